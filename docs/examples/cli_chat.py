@@ -1,11 +1,10 @@
 import asyncio
 import os
-from typing import List
 
 from dotenv import load_dotenv
 from openai import AsyncOpenAI
 
-from generic_llm_lib.llm_core.messages.models import BaseMessage
+from generic_llm_lib.llm_core.messages import HistoryHandler
 from generic_llm_lib.llm_impl import GenericOpenAI
 
 # Load environment variables from .env file
@@ -25,45 +24,57 @@ async def main() -> None:
         print("Error: OPENAI_API_KEY not found in environment variables.")
         return
 
-    # 1. Initialize the native OpenAI client
-    client = AsyncOpenAI(api_key=api_key)
-
-    # 2. Wrap it in GenericOpenAI
-    # Here we specify the model and the system instruction (persona)
-    llm = GenericOpenAI(
-        client=client,
-        model_name="gpt-4o",  # Use a valid model name
-        sys_instruction="You are a helpful assistant.",
-    )
-    print("Using OpenAI.")
-
-    # 3. Maintain conversation state using a list of BaseMessage objects
-    history: List[BaseMessage] = []
-
-    print("\nStart chatting! Type 'exit' or 'quit' to stop.")
-    while True:
-        # Get user input from the console
-        user_input = input("\nYou: ").strip()
-        if user_input.lower() in ["exit", "quit"]:
-            print("Goodbye!")
-            break
-
-        if not user_input:
-            continue
-
-        try:
-            # 4. Process the chat turn
-            # The library handles message formatting and history updates
-            result = await llm.chat(history=history, user_prompt=user_input)
-            
-            # 5. Display the assistant's response
-            print(f"Assistant: {result.content}")
-            
-            # 6. Update the local history with the result from the LLM
-            history = result.history
-
-        except Exception as e:
-            print(f"An error occurred: {e}")
+    # 1. Initialize the native OpenAI client once and keep it alive for the
+    # whole session. The context manager reuses the underlying HTTP
+    # connection pool across turns (no TLS/connect cost per message) and
+    # closes it cleanly on exit.
+    async with AsyncOpenAI(api_key=api_key) as client:
+        # 2. Wrap it in GenericOpenAI
+        # Here we specify the model and the system instruction (persona)
+        llm = GenericOpenAI(
+            client=client,
+            model_name="gpt-4o",  # Use a valid model name
+            sys_instruction="You are a helpful assistant.",
+        )
+        print("Using OpenAI.")
+
+        # 3. Maintain conversation state with a HistoryHandler. The library
+        # updates it in place after each turn and keeps message order stable:
+        # the system message stays first and prior turns are never rewritten,
+        # so the provider's automatic prompt caching can reuse the shared
+        # prefix instead of re-processing it on every turn.
+        history = HistoryHandler(system_instruction="You are a helpful assistant.")
+
+        print("\nStart chatting! Type 'exit' or 'quit' to stop.")
+        while True:
+            # Get user input from the console. input() is run in a worker
+            # thread so the event loop stays free for background tasks
+            # (cache warm-up, prefetching) while the user types.
+            user_input = (await asyncio.to_thread(input, "\nYou: ")).strip()
+            if user_input.lower() in ["exit", "quit"]:
+                print("Goodbye!")
+                break
+
+            if not user_input:
+                continue
+
+            try:
+                # Bound the per-turn cost: keep the system message plus a
+                # sliding window of the last 6 turns instead of resending the
+                # whole session every call.
+                history.trim(max_turns=6)
+
+                # 4. Process the chat turn
+                # The library handles message formatting and history updates.
+                # keep_raw=False drops the provider payload so memory stays
+                # constant per turn in this long-running loop.
+                result = await llm.chat(history=history, user_prompt=user_input, keep_raw=False)
+
+                # 5. Display the assistant's response
+                print(f"Assistant: {result.content}")
+
+            except Exception as e:
+                print(f"An error occurred: {e}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,61 @@
+"""Checks that a release version is present in pyproject.toml and CHANGELOG.md.
+
+Used by the Makefile release target: ``python scripts/check_version.py v0.1.0``.
+
+Both files are scanned line by line in binary mode so the search
+short-circuits on the first hit instead of reading and decoding the whole
+file — the changelog only grows over time and only its header region is
+relevant here.
+"""
+
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Read in large chunks; the default 8 KiB buffer means several reads for a
+# changelog of any real size.
+_BUFFER_SIZE = 131072
+
+
+def _file_has_line_prefix(path: Path, prefix: bytes) -> bool:
+    """Returns True if any line in the file starts with the given byte string.
+
+    A prefix test per line short-circuits on the first hit and avoids
+    scanning the remainder of each line, so the cost is bounded by the file
+    prefix up to the match rather than the full file size.
+    """
+    with open(path, "rb", buffering=_BUFFER_SIZE) as f:
+        for line in f:
+            if line.startswith(prefix):
+                return True
+    return False
+
+
+def check_version(version: str) -> int:
+    """Verifies pyproject.toml and CHANGELOG.md both mention the version.
+
+    Args:
+        version: The release version, with or without a leading 'v'.
+
+    Returns:
+        0 if both files are consistent, 1 otherwise.
+    """
+    plain_version = version.lstrip("v")
+
+    errors = []
+    if not _file_has_line_prefix(PROJECT_ROOT / "pyproject.toml", f'version = "{plain_version}"'.encode()):
+        errors.append(f'pyproject.toml does not contain: version = "{plain_version}"')
+    if not _file_has_line_prefix(PROJECT_ROOT / "CHANGELOG.md", f"## [{plain_version}]".encode()):
+        errors.append(f"CHANGELOG.md does not contain a '## [{plain_version}]' section")
+
+    for error in errors:
+        print(f"Error: {error}", file=sys.stderr)
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print("Usage: python scripts/check_version.py <version>", file=sys.stderr)
+        sys.exit(2)
+    sys.exit(check_version(sys.argv[1]))
@@ -1,5 +1,8 @@
 """Generic LLM Library - A provider-agnostic interface for LLMs and tools."""
 
+import importlib
+from typing import Any
+
 from .llm_core import (
     GenericLLM,
     ChatResult,
@@ -10,8 +13,16 @@ from .llm_core import (
     ToolRegistry,
     ToolDefinition,
 )
-from .llm_impl.gemini import GenericGemini, GeminiToolRegistry
-from .llm_impl.openai_api import GenericOpenAI, OpenAIToolRegistry
+
+# Provider implementations are loaded lazily (PEP 562) so that importing the
+# package does not pull in both provider SDKs; e.g. `openai` stays out of the
+# import graph unless GenericOpenAI is actually referenced.
+_LAZY_IMPORTS = {
+    "GenericGemini": "generic_llm_lib.llm_impl.gemini",
+    "GeminiToolRegistry": "generic_llm_lib.llm_impl.gemini",
+    "GenericOpenAI": "generic_llm_lib.llm_impl.openai_api",
+    "OpenAIToolRegistry": "generic_llm_lib.llm_impl.openai_api",
+}
 
 __all__ = [
     "GenericLLM",
@@ -27,3 +38,16 @@ __all__ = [
     "GenericOpenAI",
     "OpenAIToolRegistry",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Resolves lazily exported provider classes on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name), name)
+
+
+def __dir__() -> list[str]:
+    """Includes lazily exported names in introspection."""
+    return sorted(__all__)
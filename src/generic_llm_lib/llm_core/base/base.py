@@ -1,7 +1,11 @@
 """Core abstractions for LLM provider implementations."""
 
 import asyncio
-from typing import List, TypeVar, Generic, Callable, Coroutine, Any, Union
+import hashlib
+import json
+import random
+import time
+from typing import List, MutableMapping, Optional, Tuple, Type, TypeVar, Generic, Callable, Coroutine, Any, Union
 from abc import ABC, abstractmethod
 from pydantic import BaseModel
 from ..messages import BaseMessage, HistoryHandler
@@ -9,6 +13,20 @@ from ..logger import get_logger
 
 logger = get_logger(__name__)
 
+try:
+    # Optional speedup: orjson serializes several times faster than stdlib
+    # json, which matters for cache-key hashing over long histories. Falls
+    # back silently when not installed.
+    import orjson
+
+    def _stable_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS, default=str)
+
+except ImportError:  # pragma: no cover - depends on environment
+
+    def _stable_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, sort_keys=True, default=str).encode()
+
 
 ProviderResT = TypeVar("ProviderResT")
 
@@ -20,11 +38,49 @@ class ChatResult(BaseModel, Generic[ProviderResT]):
         content: Text content returned by the provider.
         history: Updated conversation history in provider-agnostic format.
         raw: Provider-specific response payload for advanced use cases.
+            None when the caller opted out via ``keep_raw=False`` to avoid
+            pinning large provider payloads across turns.
     """
 
     content: str
     history: List[BaseMessage]
-    raw: ProviderResT
+    raw: Optional[ProviderResT] = None
+
+
+class _AsyncTokenBucket:
+    """Token-bucket limiter for self-throttling provider calls.
+
+    Unlike the retry backoff (which reacts to errors), the bucket spaces
+    requests out proactively so many concurrent callers — e.g. ``batch_ask``
+    fan-outs — stay under the provider's rate limit instead of tripping it
+    and cascading into retries. Waiting uses ``asyncio.sleep``, so other
+    tasks keep running while a caller is throttled.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        """
+        Args:
+            rate: Sustained refill rate in tokens (requests) per second.
+            capacity: Maximum burst size; the bucket starts full.
+        """
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Takes one token, sleeping until the refill covers the deficit."""
+        async with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+            # Going negative reserves the caller's slot under the lock; the
+            # sleep itself happens outside so waiters queue up fairly.
+            self._tokens -= 1.0
+            wait = 0.0 if self._tokens >= 0.0 else -self._tokens / self._rate
+        if wait > 0.0:
+            await asyncio.sleep(wait)
 
 
 class GenericLLM(ABC, Generic[ProviderResT]):
@@ -34,9 +90,87 @@ class GenericLLM(ABC, Generic[ProviderResT]):
     keeping ``ChatResult.content`` and ``ChatResult.history`` consistent for consumers.
     """
 
-    def __init__(self, max_retries: int = 3, base_retry_delay: float = 1.0):
+    def __init__(
+        self,
+        max_retries: int = 3,
+        base_retry_delay: float = 1.0,
+        *,
+        response_cache: Optional[MutableMapping[str, ChatResult[ProviderResT]]] = None,
+        retryable_errors: Optional[Tuple[Type[BaseException], ...]] = None,
+        max_retry_delay: float = 30.0,
+        requests_per_minute: Optional[float] = None,
+        rate_limit_burst: int = 1,
+    ):
+        """
+        Initializes shared LLM state.
+
+        Args:
+            max_retries: Maximum number of retry attempts for provider calls.
+            base_retry_delay: Initial delay in seconds between retries.
+            response_cache: Optional mapping used to cache ChatResults keyed
+                by (model, system instruction, history, prompt). Any mutable
+                mapping works: a plain dict for exact-match caching, an LRU
+                mapping for bounded memory, or a custom store.
+            retryable_errors: Optional tuple of exception types that should be
+                retried. When provided, any other exception fails immediately
+                instead of burning through the backoff schedule (e.g. pass the
+                provider's rate-limit/connection/timeout errors). When None,
+                every exception is retried.
+            max_retry_delay: Upper bound in seconds for a single backoff sleep.
+            requests_per_minute: Optional sustained request-rate cap. When
+                set, every provider attempt (including retries) first takes
+                a token from a shared bucket, so concurrent callers
+                self-throttle instead of tripping the provider's limit.
+            rate_limit_burst: How many requests may fire back-to-back before
+                the per-minute pacing kicks in. Ignored when
+                ``requests_per_minute`` is None.
+        """
         self.max_retries = max_retries
         self.base_retry_delay = base_retry_delay
+        self.response_cache = response_cache
+        self.retryable_errors = retryable_errors
+        self.max_retry_delay = max_retry_delay
+        self._limiter: Optional[_AsyncTokenBucket] = None
+        if requests_per_minute is not None and requests_per_minute > 0:
+            self._limiter = _AsyncTokenBucket(
+                rate=requests_per_minute / 60.0, capacity=max(1.0, float(rate_limit_burst))
+            )
+        self._delays: Tuple[float, ...] = ()
+        self._delays_key: Tuple[float, int, float] = (-1.0, -1, -1.0)
+
+    def _retry_delays(self) -> Tuple[float, ...]:
+        """Returns the precomputed backoff schedule (before jitter).
+
+        The schedule is built once per retry configuration and reused across
+        calls; it is rebuilt automatically if the retry attributes change.
+        """
+        key = (self.base_retry_delay, self.max_retries, self.max_retry_delay)
+        if key != self._delays_key:
+            self._delays = tuple(
+                min(self.max_retry_delay, self.base_retry_delay * 2**i) for i in range(self.max_retries + 1)
+            )
+            self._delays_key = key
+        return self._delays
+
+    def _cache_key(self, history: List[BaseMessage], user_prompt: str) -> str:
+        """Builds a stable cache key for a chat turn.
+
+        Args:
+            history: The normalized conversation history.
+            user_prompt: The user's input message.
+
+        Returns:
+            A hex digest identifying (model, system instruction, history, prompt).
+        """
+        payload = _stable_dumps(
+            {
+                "model": getattr(self, "model", ""),
+                "system": getattr(self, "sys_instruction", ""),
+                "history": [msg.model_dump() for msg in history],
+                "prompt": user_prompt,
+            }
+        )
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
 
     async def _execute_with_retry(
         self, func: Callable[..., Coroutine[Any, Any, ChatResult[ProviderResT]]], *args: Any, **kwargs: dict[str, Any]
@@ -57,26 +191,35 @@ class GenericLLM(ABC, Generic[ProviderResT]):
             TimeoutError: If the maximum number of retries is exceeded - which actually should not happen...
         """
 
-        delay = self.base_retry_delay
+        delays = self._retry_delays()
         for attempt in range(self.max_retries + 1):
             try:
+                if self._limiter is not None:
+                    await self._limiter.acquire()
                 return await func(*args, **kwargs)
             except Exception as e:
-                # Here we could check, what kind of error it is.
+                # Permanent errors (bad key, invalid request, ...) should fail
+                # fast instead of burning through the backoff schedule.
+                if self.retryable_errors is not None and not isinstance(e, self.retryable_errors):
+                    raise
 
                 if attempt == self.max_retries:
                     raise e
 
-                logger.warning(f"API Error (Retry: {attempt + 1}/{self.max_retries}): {e}. Waiting {delay}s...")
+                # Exponential backoff with full jitter to avoid thundering
+                # herds when many concurrent calls hit the same error.
+                delay = delays[attempt] * (0.5 + random.random())
+                logger.warning(
+                    "API Error (Retry: %d/%d): %s. Waiting %.2fs...", attempt + 1, self.max_retries, e, delay
+                )
                 await asyncio.sleep(delay)
-                delay *= 2  # Exponential backoff
 
         msg = f"Failed to get response after {self.max_retries} retries."
         logger.error(msg)
         raise TimeoutError(msg)
 
     async def chat(
-        self, history: Union[List[BaseMessage], HistoryHandler], user_prompt: str
+        self, history: Union[List[BaseMessage], HistoryHandler], user_prompt: str, *, keep_raw: bool = True
     ) -> ChatResult[ProviderResT]:
         """
         Conducts a chat turn with the LLM.
@@ -84,6 +227,10 @@ class GenericLLM(ABC, Generic[ProviderResT]):
         Args:
             history: The conversation history as a list of messages or a HistoryHandler.
             user_prompt: The user's input message.
+            keep_raw: Whether to keep the provider-specific payload on the
+                result. Pass False in long-running loops that hold on to
+                ChatResults so memory stays constant per turn instead of
+                accumulating full API responses.
 
         Returns:
             A provider-specific response object containing the LLM's response
@@ -95,25 +242,86 @@ class GenericLLM(ABC, Generic[ProviderResT]):
         else:
             history_list = history
 
+        cache_key: Optional[str] = None
+        if self.response_cache is not None:
+            cache_key = self._cache_key(history_list, user_prompt)
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                logger.debug("Response cache hit for key %s.", cache_key)
+                # Hand out a copy with a fresh history list so later caller
+                # mutations (e.g. HistoryHandler.add_*) cannot corrupt the
+                # cached entry in place. keep_raw applies per caller, so the
+                # strip happens on the copy, never on the cached entry.
+                update: dict[str, Any] = {"history": list(cached.history)}
+                if not keep_raw:
+                    update["raw"] = None
+                cached = cached.model_copy(update=update)
+                if isinstance(history, HistoryHandler):
+                    history.update(cached.history)
+                return cached
+
         result = await self._execute_with_retry(self._chat_impl, history_list, user_prompt)
 
+        if self.response_cache is not None and cache_key is not None:
+            # Store a copy with its own history list: result.history is also
+            # handed to the caller (and aliased by a HistoryHandler below),
+            # so the cached entry must not share it. The entry keeps the raw
+            # payload regardless of this caller's keep_raw, so later
+            # keep_raw=True hits still see it.
+            self.response_cache[cache_key] = result.model_copy(update={"history": list(result.history)})
+
+        if not keep_raw:
+            result = result.model_copy(update={"raw": None})
+
         # Update HistoryHandler if provided
         if isinstance(history, HistoryHandler):
             history.update(result.history)
 
         return result
 
-    async def ask(self, prompt: str) -> ChatResult[ProviderResT]:
+    async def ask(self, prompt: str, *, keep_raw: bool = True) -> ChatResult[ProviderResT]:
         """
         Single-turn question without maintaining history.
 
         Args:
             prompt: The question to ask.
+            keep_raw: Whether to keep the provider-specific payload on the result.
 
         Returns:
             A provider-specific response object containing the LLM's response.
         """
-        return await self.chat([], prompt)
+        return await self.chat([], prompt, keep_raw=keep_raw)
+
+    async def batch_ask(
+        self, prompts: List[str], max_concurrency: int = 32, history: Optional[List[BaseMessage]] = None
+    ) -> List[Union[ChatResult[ProviderResT], BaseException]]:
+        """
+        Fans out multiple single-turn questions with bounded concurrency.
+
+        Sequential calls are network-latency-bound; running them concurrently
+        scales throughput roughly linearly up to the provider's rate limits.
+        All requests are submitted up front; the semaphore only limits how
+        many are in flight at once.
+
+        Args:
+            prompts: The questions to ask, one independent request each.
+            max_concurrency: Maximum number of requests in flight at once.
+            history: Optional shared conversation prefix. Each prompt runs
+                against its own copy, so requests do not see each other.
+
+        Returns:
+            One entry per prompt, in order: either the ChatResult or the
+            exception that request ultimately raised after retries.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _one(prompt: str) -> ChatResult[ProviderResT]:
+            async with semaphore:
+                if history is None:
+                    return await self.ask(prompt)
+                return await self.chat(list(history), prompt)
+
+        return await asyncio.gather(*(_one(p) for p in prompts), return_exceptions=True)
 
     @abstractmethod
     async def _chat_impl(self, history: List[BaseMessage], user_prompt: str) -> ChatResult[ProviderResT]:
@@ -67,6 +67,32 @@ class HistoryHandler:
         """
         self._messages = messages
 
+    def trim(self, max_turns: int) -> None:
+        """
+        Trims the history to a sliding window of the most recent turns.
+
+        A turn starts at a user message and spans everything up to the next
+        one. A leading system message is always kept, so the prompt prefix
+        stays stable while per-call cost is bounded in long sessions.
+
+        Args:
+            max_turns: Maximum number of most recent turns to keep.
+        """
+        if max_turns <= 0:
+            raise ValueError("max_turns must be positive.")
+
+        prefix: List[BaseMessage] = []
+        rest = self._messages
+        if rest and isinstance(rest[0], SystemMessage):
+            prefix = rest[:1]
+            rest = rest[1:]
+
+        turn_starts = [i for i, msg in enumerate(rest) if isinstance(msg, UserMessage)]
+        if len(turn_starts) <= max_turns:
+            return
+
+        self._messages = prefix + rest[turn_starts[-max_turns] :]
+
     def clean_tool_calls(self) -> None:
         """
         Removes intermediate tool calls and responses from the history.
@@ -74,19 +100,25 @@ class HistoryHandler:
         Keeps user messages, system messages, and assistant messages that have content.
         This is useful for saving context window space.
         """
+        # Most histories have nothing to clean; one early scan avoids
+        # rebuilding the message list in that case.
+        if not any(
+            isinstance(msg, ToolMessage) or (isinstance(msg, AssistantMessage) and msg.tool_calls)
+            for msg in self._messages
+        ):
+            return
+
         cleaned: List[BaseMessage] = []
         for msg in self._messages:
             if isinstance(msg, ToolMessage):
                 continue
 
-            if isinstance(msg, AssistantMessage):
-                if msg.tool_calls:
-                    if msg.content:
-                        # Keep content, remove tool_calls
-                        cleaned.append(AssistantMessage(content=msg.content, tool_calls=None))
-                    # If no content, skip
-                else:
-                    cleaned.append(msg)
+            if isinstance(msg, AssistantMessage) and msg.tool_calls:
+                if msg.content:
+                    # Keep content, remove tool_calls. model_copy is a shallow
+                    # copy without re-validation, cheaper than reconstructing.
+                    cleaned.append(msg.model_copy(update={"tool_calls": None}))
+                # If no content, skip
             else:
                 cleaned.append(msg)
 
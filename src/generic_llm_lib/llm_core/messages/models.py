@@ -1,6 +1,6 @@
 """Provider-agnostic message models for chat history."""
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from abc import ABC
 from typing import Optional, List, Any
 
@@ -8,11 +8,17 @@ from typing import Optional, List, Any
 class BaseMessage(ABC, BaseModel):
     """Base model for messages exchanged with an LLM.
 
+    Messages are immutable value objects: they are validated once at
+    construction and never revalidated or mutated afterwards, which keeps
+    history appends in long-running chat loops cheap.
+
     Attributes:
         role: Role associated with the message (e.g., 'user', 'assistant', 'system').
         content: Text payload of the message.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     role: str
     content: str
 
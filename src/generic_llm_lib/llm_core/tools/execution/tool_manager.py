@@ -1,20 +1,53 @@
+import importlib.machinery
 import importlib.util
-import inspect
 import os
 import json
+import sys
+import threading
+import time
+import types
 import warnings
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import chain
 from pathlib import Path
-from typing import Annotated, Any, Dict, TypeVar, Generic, Literal
+from typing import Annotated, Any, Dict, Optional, Sequence, TypeVar, Generic, Literal
 
 from pydantic import Field
 
-from ...exceptions import ToolLoadError
+from ...exceptions import ToolLoadError, ToolNotFoundError
 from ..registry import ToolRegistry, ToolFactory
 from ...logger import get_logger
 
 logger = get_logger(__name__)
 R = TypeVar("R", bound=ToolRegistry)
 
+# How long a known-missing plugin path is trusted before re-statting. LLMs
+# tend to retry a misspelled tool name several times in quick succession.
+_MISSING_PATH_TTL = 2.0
+
+try:
+    # Optional speedup: orjson parses and serializes several times faster
+    # than stdlib json. Falls back silently when not installed.
+    import orjson
+
+    def _json_loads(data: str) -> Any:
+        return orjson.loads(data)
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+except ImportError:  # pragma: no cover - depends on environment
+    # One decoder reused across calls: calling its bound decode skips the
+    # json.loads wrapper's per-call argument handling.
+    _decoder = json.JSONDecoder()
+
+    def _json_loads(data: str) -> Any:
+        return _decoder.decode(data)
+
+    def _json_dumps(obj: Any) -> str:
+        return json.dumps(obj)
+
 
 class ToolManager(Generic[R]):
     """
@@ -32,7 +65,41 @@ class ToolManager(Generic[R]):
         """
         self.registry = registry
         self.tools_dir = Path(tools_dir)
-        self._module_cache: Dict[str, Any] = {}
+        # Resolved once: the browse security check compares plain strings
+        # against this root instead of re-resolving the tools dir per call.
+        self._tools_root = os.path.realpath(self.tools_dir) + os.sep
+        # LRU-bounded: long-running agents can load hundreds of modules over a
+        # session; evicting the oldest entry keeps resident memory bounded.
+        self._module_cache: "OrderedDict[str, Any]" = OrderedDict()
+        self._module_cache_max = 128
+        # Dotted plugin path -> absolute .py file path.
+        self._path_cache: Dict[str, str] = {}
+        # Rendered inspect_plugin output keyed by plugin path, invalidated by
+        # the source file's mtime. LLMs re-inspect the same plugin often while
+        # planning, and each render pays a schema generation per function.
+        self._inspect_cache: Dict[str, tuple[float, str]] = {}
+        # Plugin path -> monotonic deadline until which the path is treated as
+        # missing without another stat syscall.
+        self._missing_until: Dict[str, float] = {}
+        # Resolved directory -> (mtime, rendered listing) for browse_plugins.
+        self._browse_cache: Dict[str, tuple[float, str]] = {}
+        # Guards cache writes when modules are loaded concurrently (warmup).
+        self._cache_lock = threading.Lock()
+        # Pre-serialized parameter-schema JSON per tool function. Generating a
+        # definition runs pydantic create_model + jsonref per function, so
+        # repeat inspections (common when an LLM re-browses) become a lookup.
+        self._schema_json_cache: Dict[Any, str] = {}
+        # One FileFinder per plugin directory; reuses its cached directory
+        # listing and loader chain instead of rebuilding a spec from scratch
+        # on every module load.
+        self._finder_cache: Dict[str, importlib.machinery.FileFinder] = {}
+        # LRU of dynamic tools kept registered between proxy calls. Repeat
+        # calls to a hot (plugin, function) pair skip the full
+        # load/register/unregister cycle (including schema generation) and
+        # reduce to a dict lookup; the least recently used tool is
+        # unregistered once the cache is full.
+        self._live_tools: "OrderedDict[tuple[str, str], None]" = OrderedDict()
+        self._live_tools_max = 64
         self.mode = mode
         self._register_default_tools()
 
@@ -74,39 +141,171 @@ class ToolManager(Generic[R]):
             FileNotFoundError: If the module file does not exist.
             ImportError: If the module cannot be loaded.
         """
-        if plugin_path in self._module_cache:
+        # Interned keys let the dict lookups below hit the pointer-identity
+        # fast path; the same plugin names recur across hundreds of calls.
+        plugin_path = sys.intern(plugin_path)
+        cached_module = self._module_cache.get(plugin_path)
+        if cached_module is not None:
             logger.debug("Tool module cache hit for '%s'.", plugin_path)
-            return self._module_cache[plugin_path]
+            self._module_cache.move_to_end(plugin_path)
+            return cached_module
+
+        # Deduplicate against the interpreter's own import cache: the same
+        # module may already be loaded under its dynamic_tools name.
+        module_name = f"dynamic_tools.{plugin_path}"
+        existing = sys.modules.get(module_name)
+        if existing is not None:
+            with self._cache_lock:
+                self._module_cache[plugin_path] = existing
+            return existing
 
-        # Convert dotted path to file path
         logger.debug("Loading tool module '%s' from '%s'.", plugin_path, self.tools_dir)
-        relative_path = plugin_path.replace(".", os.sep) + ".py"
-        file_path = self.tools_dir / relative_path
+        file_path = self._plugin_file(plugin_path)
+
+        deadline = self._missing_until.get(plugin_path)
+        if deadline is not None:
+            if time.monotonic() < deadline:
+                raise FileNotFoundError(f"Module {plugin_path} not found at {file_path}")
+            del self._missing_until[plugin_path]
 
-        if not file_path.exists():
+        if not os.path.isfile(file_path):
+            self._missing_until[plugin_path] = time.monotonic() + _MISSING_PATH_TTL
             msg = f"Module {plugin_path} not found at {file_path}"
             logger.error(msg)
             raise FileNotFoundError(msg)
 
-        module_name = f"dynamic_tools.{plugin_path}"
-        spec = importlib.util.spec_from_file_location(module_name, file_path)
+        spec = self._find_spec(module_name, file_path)
         if spec is None or spec.loader is None:
             msg = f"Could not load spec for module {plugin_path}"
             logger.error(msg)
             raise ImportError(msg)
 
         module = importlib.util.module_from_spec(spec)
+        # Published before exec so relative imports inside the plugin resolve
+        # to this instance instead of re-triggering a load.
+        sys.modules[module_name] = module
         try:
             spec.loader.exec_module(module)
         except Exception as e:
+            sys.modules.pop(module_name, None)
             msg = f"Failed to execute module {plugin_path}: {e}"
             logger.error(msg, exc_info=True)
             raise ImportError(msg) from e
 
-        self._module_cache[plugin_path] = module
+        with self._cache_lock:
+            self._module_cache[plugin_path] = module
+            while len(self._module_cache) > self._module_cache_max:
+                evicted_path, _ = self._module_cache.popitem(last=False)
+                # Drop any interpreter-level reference too so the evicted
+                # module's globals become collectable.
+                sys.modules.pop(f"dynamic_tools.{evicted_path}", None)
         logger.debug("Loaded tool module '%s'.", plugin_path)
         return module
 
+    def warmup(self, parallel: int = 8) -> int:
+        """
+        Pre-imports every plugin module under the tools directory.
+
+        A freshly started manager otherwise pays the full parse-and-exec cost
+        on the first use of each plugin. Modules are loaded through a thread
+        pool so disk reads overlap; plugin top-level code must therefore be
+        idempotent and thread-safe.
+
+        Args:
+            parallel: Maximum number of modules loading concurrently.
+
+        Returns:
+            The number of modules successfully loaded.
+        """
+        root = os.path.realpath(self.tools_dir)
+        dotted_paths = []
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = [d for d in dirnames if not d.startswith("_")]
+            rel = os.path.relpath(dirpath, root)
+            prefix = "" if rel == "." else rel.replace(os.sep, ".") + "."
+            for filename in filenames:
+                if filename.endswith(".py") and not filename.startswith("_"):
+                    dotted_paths.append(prefix + filename[:-3])
+
+        loaded = 0
+        with ThreadPoolExecutor(max_workers=parallel) as executor:
+            futures = {executor.submit(self._get_module, p): p for p in dotted_paths}
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                    loaded += 1
+                except Exception as e:
+                    logger.warning("Warmup failed for plugin '%s': %s", futures[future], e)
+
+        logger.info("Warmup loaded %d/%d plugin modules.", loaded, len(dotted_paths))
+        return loaded
+
+    def _plugin_file(self, plugin_path: str) -> str:
+        """Returns the absolute .py path for a dotted plugin path, cached.
+
+        Args:
+            plugin_path: Dotted path to the plugin (e.g., 'database.mysql').
+
+        Returns:
+            The absolute file path of the plugin source.
+        """
+        file_path = self._path_cache.get(plugin_path)
+        if file_path is None:
+            file_path = os.path.join(self._tools_root, *plugin_path.split(".")) + ".py"
+            self._path_cache[plugin_path] = file_path
+        return file_path
+
+    def _find_spec(self, module_name: str, file_path: str) -> Optional[importlib.machinery.ModuleSpec]:
+        """
+        Finds a module spec via a per-directory FileFinder, with fallback.
+
+        The finder keeps the directory listing cached (invalidated by mtime)
+        and reuses the standard source loader, which also means compiled
+        bytecode in __pycache__ is picked up on repeat loads.
+
+        Args:
+            module_name: Fully qualified name to assign to the module.
+            file_path: Path to the module's .py file.
+
+        Returns:
+            The module spec, or None if it could not be created.
+        """
+        directory = os.path.dirname(file_path)
+        finder = self._finder_cache.get(directory)
+        if finder is None:
+            finder = importlib.machinery.FileFinder(directory, (importlib.machinery.SourceFileLoader, [".py"]))
+            self._finder_cache[directory] = finder
+
+        # FileFinder resolves the last dotted component within its directory.
+        spec = finder.find_spec(module_name)
+        if spec is not None and spec.loader is not None:
+            return spec
+        return importlib.util.spec_from_file_location(module_name, file_path)
+
+    def _get_schema_json(self, func: Any) -> str:
+        """
+        Returns the serialized parameter schema for a tool function, cached.
+
+        Args:
+            func: The tool function to describe.
+
+        Returns:
+            The JSON string of the function's parameter schema, or an error
+            placeholder if the schema could not be generated.
+        """
+        cached = self._schema_json_cache.get(func)
+        if cached is not None:
+            return cached
+
+        try:
+            tool_def = ToolFactory().generate_tool_definition(func)
+            schema_str = _json_dumps(tool_def.parameters)
+        except Exception:
+            schema_str = "Could not extract schema!"
+
+        self._schema_json_cache[func] = schema_str
+        return schema_str
+
     def browse_plugins(
         self,
         path: Annotated[
@@ -119,41 +318,74 @@ class ToolManager(Generic[R]):
         Returns:
             A string listing directories and modules.
         """
-        target = self.tools_dir / path
-        logger.debug(f"Browsing tools directory '{self.tools_dir}' with path '{path}'.", self.tools_dir, path)
-
-        # Security check to prevent traversing up
-        try:
-            target.resolve().relative_to(self.tools_dir.resolve())
-        except ValueError:
+        # Plain string join: pathlib's __truediv__/_parse_args chain is far
+        # more expensive than os.path.join on this per-call path.
+        target = os.path.join(self._tools_root, path)
+        logger.debug("Browsing tools directory '%s' with path '%s'.", self.tools_dir, path)
+
+        # Security check to prevent traversing up: one realpath on the target,
+        # then a plain string prefix test against the pre-resolved root.
+        resolved = os.path.realpath(target)
+        if resolved + os.sep != self._tools_root and not resolved.startswith(self._tools_root):
             msg = f"Error: Access denied. Cannot browse outside tools directory. Use the following path: '{self.tools_dir}' to browse your tools."
             logger.warning("Browse denied for path '%s'.", path)
             return msg
 
-        if not target.exists():
+        if not os.path.exists(resolved):
             msg = f"Error: Path not found. Use the following path: '{self.tools_dir}' to browse your tools."
             logger.warning(f"Browse path not found: {target}")
             return msg
 
-        entries = []
+        # Agents re-browse the same directories repeatedly while exploring;
+        # the rendered listing is reused until the directory mtime changes.
+        try:
+            dir_mtime: Optional[float] = os.stat(resolved).st_mtime
+        except OSError:
+            dir_mtime = None
+        if dir_mtime is not None:
+            cached = self._browse_cache.get(resolved)
+            if cached is not None and cached[0] == dir_mtime:
+                return cached[1]
+
+        dirs: list[str] = []
+        mods: list[str] = []
         try:
-            for item in target.iterdir():
-                if item.is_dir() and not item.name.startswith("_"):
-                    entries.append(f"[DIR] {item.name}/")
-                elif item.suffix == ".py" and not item.name.startswith("_"):
-                    entries.append(f"[MOD] {item.stem}")
+            # os.scandir exposes the entry type cached from the directory
+            # listing, avoiding a stat syscall and a Path allocation per entry.
+            with os.scandir(resolved) as it:
+                for entry in it:
+                    name = entry.name
+                    # Slice compare beats a startswith method call per entry,
+                    # and skipping early avoids the is_dir check for dunders.
+                    if name[:1] == "_":
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        dirs.append(name)
+                    elif name.endswith(".py"):
+                        mods.append(name[:-3])
         except Exception as e:
             msg = f"Error browsing directory: {e}. Use the following path: '{self.tools_dir}' to browse your tools."
             logger.error(msg, exc_info=True)
             return msg
 
-        if not entries:
+        if not dirs and not mods:
             logger.info(
-                f"Tools directory is empty at {target}. Make sure you are using the correct path: {self.tools_dir} to browse your tools"
+                "Tools directory is empty at %s. Make sure you are using the correct path: %s to browse your tools",
+                target,
+                self.tools_dir,
             )
-            return "Directory is empty."
+            result = "Directory is empty."
+        else:
+            # Sort the bare names (shorter comparison keys than prefixed
+            # strings) and defer the prefix formatting to the join; directory
+            # entries always come first, matching the old mixed sort.
+            dirs.sort()
+            mods.sort()
+            result = "\n".join(chain((f"[DIR] {d}/" for d in dirs), (f"[MOD] {m}" for m in mods)))
 
-        return "\n".join(sorted(entries))
+        if dir_mtime is not None:
+            self._browse_cache[resolved] = (dir_mtime, result)
+        return result
 
     def inspect_plugin(
         self, plugin_path: Annotated[str, Field(description="Dotted path to the module (e.g., 'database.mysql')")]
@@ -164,26 +396,40 @@ class ToolManager(Generic[R]):
         Returns:
             A list of available tools in the module with their descriptions.
         """
+        plugin_path = sys.intern(plugin_path)
         try:
             logger.debug("Inspecting plugin '%s'.", plugin_path)
+            try:
+                mtime: Optional[float] = os.stat(self._plugin_file(plugin_path)).st_mtime
+            except OSError:
+                mtime = None
+            if mtime is not None:
+                cached = self._inspect_cache.get(plugin_path)
+                if cached is not None and cached[0] == mtime:
+                    return cached[1]
+
             module = self._get_module(plugin_path)
-            tools = []
-            for name, obj in inspect.getmembers(module, inspect.isfunction):
-                # We look for functions with docstrings (ToolRegistry standard)
-                if not name.startswith("_") and obj.__doc__:
-                    # Get first line of docstring
-                    try:
-                        tool_def = ToolFactory().generate_tool_definition(obj)
-                        schema_str = json.dumps(tool_def.parameters)
-                    except Exception:
-                        schema_str = "Could not extract schema!"
-
-                    tools.append(f"- {name}: {obj.__doc__}\n  Expected kwargs_json Format: {schema_str}")
-            if not tools:
+            # Scan the module dict directly: no sorted getattr round-trips as
+            # with inspect.getmembers, and re-exported functions are skipped
+            # via the __module__ check. We look for public functions with
+            # docstrings (ToolRegistry standard).
+            listing = "\n".join(
+                f"- {name}: {obj.__doc__}\n  Expected kwargs_json Format: {self._get_schema_json(obj)}"
+                for name, obj in vars(module).items()
+                if type(obj) is types.FunctionType
+                and obj.__module__ == module.__name__
+                and name[:1] != "_"
+                and obj.__doc__
+            )
+            if not listing:
                 logger.info("No tools found in '%s'.", plugin_path)
-                return f"No tools found in '{plugin_path}'."
+                result = f"No tools found in '{plugin_path}'."
+            else:
+                result = f"Available tools in '{plugin_path}':\n" + listing
 
-            return f"Available tools in '{plugin_path}':\n" + "\n".join(tools)
+            if mtime is not None:
+                self._inspect_cache[plugin_path] = (mtime, result)
+            return result
         except Exception as e:
             msg = f"Error inspecting plugin: {str(e)}"
             logger.error(msg, exc_info=True)
@@ -193,7 +439,7 @@ class ToolManager(Generic[R]):
         self,
         plugin_path: Annotated[str, Field(description="Dotted path to the module")],
         function_name: Annotated[str, Field(description="Name of the function to execute")],
-        kwargs_json: Annotated[dict[str, Any], Field(description="JSON string of the function's arguments")],
+        kwargs_json: Annotated[str, Field(description="JSON string of the function's arguments")],
     ) -> str:
         """Executes a function from a dynamic plugin module.
 
@@ -201,34 +447,115 @@ class ToolManager(Generic[R]):
             The result of the function execution as a string, or an error message.
         """
 
-        from .scoped_tool import ScopedTool
-
+        plugin_path = sys.intern(plugin_path)
+        function_name = sys.intern(function_name)
         logger.info("Executing dynamic tool '%s' from '%s'.", function_name, plugin_path)
+
+        # Fast path: the tool is still registered from a previous call, so the
+        # whole load/register cycle collapses into a lookup.
+        key = (plugin_path, function_name)
+        if key in self._live_tools and function_name in self.registry.tools:
+            self._live_tools.move_to_end(key)
+            return self._call_registered(function_name, kwargs_json)
+
+        # The same function name loaded from another plugin would collide in
+        # the registry; retire the stale entry first.
+        stale = next((k for k in self._live_tools if k[1] == function_name), None)
+        if stale is not None:
+            del self._live_tools[stale]
+            self._unregister_quietly(function_name)
+
+        try:
+            load_msg = self.load_specific_tool(plugin_path, function_name)
+        except ToolLoadError:
+            return f"Critical Error: Could not load '{function_name}' from '{plugin_path}'"
+
+        # Only tools this manager registered join the LRU; a pre-existing
+        # registration (load_specific_tool's no-op path) is not ours to evict.
+        if "is now active" in load_msg:
+            self._live_tools[key] = None
+            while len(self._live_tools) > self._live_tools_max:
+                (_, evicted_name), _ = self._live_tools.popitem(last=False)
+                self._unregister_quietly(evicted_name)
+
+        return self._call_registered(function_name, kwargs_json)
+
+    def _call_registered(self, function_name: str, kwargs_json: Any) -> str:
+        """Parses arguments, invokes a registered tool and formats the outcome.
+
+        When the tool's definition carries an `args_model`, the raw JSON is
+        parsed and validated in a single pydantic-core call; otherwise the
+        arguments are decoded without validation, as before.
+
+        Args:
+            function_name: Name of the registered tool function.
+            kwargs_json: JSON string with the keyword arguments for the call.
+
+        Returns:
+            The stringified result, or an error message.
+        """
+        tool_def = self.registry.tools.get(function_name)
         try:
-            kwargs = json.loads(kwargs_json)  # type: ignore
-        except json.JSONDecodeError as e:
+            # Empty payloads are the most common tool-call arguments by far;
+            # skip parser (and validator) entry entirely for them.
+            if isinstance(kwargs_json, str) and kwargs_json.strip() in ("", "{}"):
+                kwargs = {}
+            else:
+                args_model = getattr(tool_def, "args_model", None)
+                if args_model is not None:
+                    kwargs = args_model.model_validate_json(kwargs_json).model_dump()
+                else:
+                    kwargs = _json_loads(kwargs_json)  # type: ignore
+        except ValueError as e:
+            # Covers json/orjson decode errors and pydantic ValidationError.
             msg = f"Error parsing the arguments: {e}"
             logger.error(msg)
             return msg
 
-        with ScopedTool(self, plugin_path, function_name) as scoped:
-            if not scoped.successfully_loaded:
-                return f"Critical Error: Could not load '{function_name}' from '{plugin_path}'"
+        try:
+            # The definition fetched above already carries the callable, so
+            # the implementations dict is only consulted as a fallback.
+            func = getattr(tool_def, "func", None) or self.registry.implementations.get(function_name)
+            if func is None:
+                msg = f"Error: Tool '{function_name}' is not available in the registry."
+                logger.error(msg)
+                return msg
+            result = func(**kwargs)
+            logger.debug("Tool '%s' executed successfully.", function_name)
+            return str(result)
+
+        except Exception as e:
+            msg = f"Error executing '{function_name}': {str(e)}"
+            logger.error(msg, exc_info=True)
+            return msg
+
+    def execute_dynamic_plugins_batch(self, calls: Sequence[tuple[str, str, str]]) -> list[str]:
+        """Executes several dynamic tool calls from one model turn.
+
+        Modules are prefetched once per distinct plugin, so parallel calls
+        that share a plugin amortize the import; each call then dispatches
+        through the warm single-call path.
 
+        Args:
+            calls: (plugin_path, function_name, kwargs_json) triples.
+
+        Returns:
+            One result string per call, in request order.
+        """
+        for plugin_path in dict.fromkeys(call[0] for call in calls):
             try:
-                func = self.registry.implementations.get(function_name)
-                if func is None:
-                    msg = f"Error: Tool '{function_name}' is not available in the registry."
-                    logger.error(msg)
-                    return msg
-                result = func(**kwargs)
-                logger.debug("Tool '%s' executed successfully.", function_name)
-                return str(result)
-
-            except Exception as e:
-                msg = f"Error executing '{function_name}': {str(e)}"
-                logger.error(msg, exc_info=True)
-                return msg
+                self._get_module(plugin_path)
+            except Exception:
+                # The per-call path reports load errors in its result string.
+                pass
+        return [self.execute_dynamic_plugin(*call) for call in calls]
+
+    def _unregister_quietly(self, function_name: str) -> None:
+        """Unregisters a tool, ignoring the case where it is already gone."""
+        try:
+            self.registry.unregister(function_name)
+        except ToolNotFoundError:
+            pass
 
     def load_specific_tool(
         self,
@@ -241,6 +568,20 @@ class ToolManager(Generic[R]):
         Returns:
             Success or error message.
         """
+        plugin_path = sys.intern(plugin_path)
+        function_name = sys.intern(function_name)
+
+        # LLMs re-issue load calls as a safety no-op; answering from the
+        # registry skips the module import and schema re-validation. Only
+        # short-circuit when the registered function really comes from this
+        # plugin module — a same-named tool from another source must fall
+        # through to the registration collision error below.
+        registered = self.registry.implementations.get(function_name)
+        if registered is not None and getattr(registered, "__module__", None) == f"dynamic_tools.{plugin_path}":
+            msg = f"Success: Tool '{function_name}' is already active."
+            logger.debug(msg)
+            return msg
+
         try:
             logger.info("Loading tool '%s' from '%s'.", function_name, plugin_path)
             module = self._get_module(plugin_path)
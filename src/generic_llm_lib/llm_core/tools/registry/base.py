@@ -33,6 +33,9 @@ class ToolRegistry(ABC):
         """Initialize the ToolRegistry."""
         self.tools: Dict[str, ToolDefinition] = {}
         self.tool_factory: ToolFactory = ToolFactory()
+        # Live name -> callable view maintained on (un)registration so the
+        # per-tool-call lookup doesn't rebuild a dict each time.
+        self._impls: Dict[str, Callable] = {}
 
     def _register_tool_definition(self, tool: ToolDefinition) -> None:
         """Registers a ToolDefinition object directly."""
@@ -42,6 +45,7 @@ class ToolRegistry(ABC):
             raise ToolRegistrationError(msg)
 
         self.tools[tool.name] = tool
+        self._impls[tool.name] = tool.func
         logger.info(f"Successfully registered tool: '{tool.name}'")
 
     def _register_callable(self, func: Callable, name: Optional[str] = None, description: Optional[str] = None) -> None:
@@ -111,6 +115,7 @@ class ToolRegistry(ABC):
         """
         if tool_name in self.tools:
             del self.tools[tool_name]
+            self._impls.pop(tool_name, None)
             logger.info(f"Successfully unregistered tool: '{tool_name}'")
         else:
             raise ToolNotFoundError(f"Tool '{tool_name}' not found in the registry.")
@@ -139,9 +144,11 @@ class ToolRegistry(ABC):
 
     @property
     def implementations(self) -> Dict[str, Callable]:
-        """Returns a dictionary mapping function names to their callables.
+        """Returns the live dictionary mapping function names to their callables.
 
         Returns:
             A dictionary where keys are tool names and values are the functions.
+            The same dictionary instance is returned on every access; it is
+            kept in sync by register/unregister.
         """
-        return {name: tool.func for name, tool in self.tools.items()}
+        return self._impls
@@ -6,9 +6,11 @@ to automatically generate tool schemas and metadata from functions, ensuring
 they are compatible with LLM tool calling interfaces.
 """
 
+import hashlib
+import json
+from functools import lru_cache
 from typing import Callable, Dict, Any, Optional, cast
 
-import jsonref  # type: ignore
 from pydantic import create_model
 
 from ..models import ToolDefinition
@@ -21,6 +23,29 @@ import inspect
 logger = get_logger(__name__)
 
 
+# Post-sanitization schemas keyed by a digest of the raw pydantic schema.
+# Different functions with structurally identical signatures share one entry,
+# so only the first of them pays for ref resolution and sanitization.
+_SANITIZED_SCHEMA_CACHE: Dict[bytes, Dict[str, Any]] = {}
+
+
+def _schema_digest(schema: Dict[str, Any]) -> bytes:
+    """Returns a stable content hash for a JSON-compatible schema dict."""
+    payload = json.dumps(schema, sort_keys=True, default=str).encode()
+    return hashlib.blake2b(payload, digest_size=16).digest()
+
+
+def _has_ref(node: Any) -> bool:
+    """Returns True if the schema contains a '$ref' anywhere."""
+    if isinstance(node, dict):
+        if "$ref" in node:
+            return True
+        return any(_has_ref(value) for value in node.values())
+    if isinstance(node, list):
+        return any(_has_ref(item) for item in node)
+    return False
+
+
 class ToolFactory:
     """Creates tools from Callables, schemas and so on."""
 
@@ -29,6 +54,24 @@ class ToolFactory:
     ) -> ToolDefinition:
         """Generate a ToolDefinition from a callable function.
 
+        Args:
+            func: The function to generate a definition for.
+            name: Optional name override for the tool.
+            description: Optional description override for the tool.
+
+        Returns:
+            A ToolDefinition object containing the tool's metadata and schema.
+
+        Raises:
+            ToolValidationError: If the function is missing a docstring or parameter descriptions.
+        """
+        return _build_tool_definition(func, name, description)
+
+    def _generate_tool_definition(
+        self, func: Callable, name: Optional[str] = None, description: Optional[str] = None
+    ) -> ToolDefinition:
+        """Runs the full schema pipeline for a callable (uncached).
+
         Args:
             func: The function to generate a definition for.
             name: Optional name override for the tool.
@@ -56,21 +99,42 @@ class ToolFactory:
         dynamic_params_model = create_model(f"{tool_name}Params", **cast(Dict[str, Any], fields))
         raw_schema = dynamic_params_model.model_json_schema()
 
-        # 1. Preserve $ref siblings before resolving refs
-        transformed_schema = preserve_ref_siblings(raw_schema)
-
-        # 2. Check for recursion
-        SchemaValidator.assert_no_recursive_refs(transformed_schema)
-
-        # 3. Resolve refs using jsonref
-        # proxies=False ensures we get a plain dict back, not JsonRef objects
-        parameters_schema = jsonref.replace_refs(transformed_schema, proxies=False)
-
-        # 4. Flatten single-element allOf arrays (restore simple structure)
-        parameters_schema = flatten_single_all_of(parameters_schema)
+        digest = _schema_digest(raw_schema)
+        cached_schema = _SANITIZED_SCHEMA_CACHE.get(digest)
+        if cached_schema is not None:
+            return ToolDefinition(
+                name=tool_name,
+                description=description,
+                func=func,
+                parameters=cached_schema,
+                args_model=dynamic_params_model,
+            )
+
+        if _has_ref(raw_schema):
+            # Imported lazily: ref resolution is the only consumer of jsonref,
+            # and simple Annotated[...] tools never reach this branch.
+            import jsonref  # type: ignore
+
+            # 1. Preserve $ref siblings before resolving refs
+            transformed_schema = preserve_ref_siblings(raw_schema)
+
+            # 2. Check for recursion
+            SchemaValidator.assert_no_recursive_refs(transformed_schema)
+
+            # 3. Resolve refs using jsonref
+            # proxies=False ensures we get a plain dict back, not JsonRef objects
+            parameters_schema = jsonref.replace_refs(transformed_schema, proxies=False)
+
+            # 4. Flatten single-element allOf arrays (restore simple structure)
+            parameters_schema = flatten_single_all_of(parameters_schema)
+        else:
+            # No $ref anywhere: the preserve/resolve/flatten steps are
+            # no-ops, so skip their deep copies entirely.
+            parameters_schema = raw_schema
 
         # 5. Sanitize schema (remove $defs, title, etc.)
         parameters_schema = SchemaValidator.sanitize_schema(parameters_schema)
+        _SANITIZED_SCHEMA_CACHE[digest] = parameters_schema
 
         return ToolDefinition(
             name=tool_name,
@@ -99,3 +163,15 @@ class ToolFactory:
             ft = ToolParameterFactory.build_field_tuple(param_name=param_name, param=param, tool_name=tool_name)
             fields[param_name] = (ft.annotation, ft.field)
         return fields
+
+
+@lru_cache(maxsize=1024)
+def _build_tool_definition(func: Callable, name: Optional[str], description: Optional[str]) -> ToolDefinition:
+    """Memoized schema pipeline, keyed by function identity and overrides.
+
+    The pipeline (signature reflection, create_model, ref resolution,
+    sanitization) is pure with respect to its inputs, so repeated
+    registrations of the same function — e.g. every dynamic tool load —
+    reuse the cached ToolDefinition instead of rebuilding it.
+    """
+    return ToolFactory()._generate_tool_definition(func, name=name, description=description)
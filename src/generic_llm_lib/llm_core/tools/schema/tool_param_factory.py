@@ -1,5 +1,6 @@
 import inspect
-from typing import Any, get_origin, Annotated, get_args
+from functools import lru_cache
+from typing import Any, Optional, get_origin, Annotated, get_args
 from pydantic import Field, BaseModel, ConfigDict
 from pydantic.fields import FieldInfo
 from generic_llm_lib.llm_core.exceptions.exceptions import ToolValidationError
@@ -9,6 +10,26 @@ from ...logger import get_logger
 logger = get_logger(__name__)
 
 
+def _description_from_annotation(annotation: Any) -> Optional[str]:
+    """Extracts the Field description from an Annotated type, or None."""
+    if get_origin(annotation) is Annotated:
+        for metadata in get_args(annotation):
+            if isinstance(metadata, FieldInfo) and metadata.description:
+                return metadata.description
+    return None
+
+
+@lru_cache(maxsize=2048)
+def _cached_description_from_annotation(annotation: Any) -> Optional[str]:
+    """Cached variant of _description_from_annotation.
+
+    typing caches Annotated[...] instances, so identical parameter
+    annotations across tool modules hit the same cache entry and skip the
+    get_origin/get_args walk on re-registration.
+    """
+    return _description_from_annotation(annotation)
+
+
 class FieldTuple(BaseModel):
     """Ensures, that the dynamic model field definition is correctly typed for Pydantic's create_model."""
 
@@ -54,10 +75,14 @@ class ToolParameterFactory:
             ToolValidationError: If the parameter is missing a Pydantic Field description.
         """
 
-        if get_origin(annotation) is Annotated:
-            for metadata in get_args(annotation):
-                if isinstance(metadata, FieldInfo) and metadata.description:
-                    return metadata.description
+        try:
+            description = _cached_description_from_annotation(annotation)
+        except TypeError:
+            # Unhashable annotations can't be cached; extract directly.
+            description = _description_from_annotation(annotation)
+
+        if description is not None:
+            return description
 
         msg = (
             f"Parameter '{param_name}' in tool '{tool_name}' is missing a description.\n"
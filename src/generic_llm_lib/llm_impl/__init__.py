@@ -1,7 +1,16 @@
 """Concrete LLM provider implementations."""
 
-from .gemini import GenericGemini, GeminiToolRegistry
-from .openai_api import GenericOpenAI, OpenAIToolRegistry
+import importlib
+from typing import Any
+
+# Each provider subpackage is imported on first attribute access (PEP 562)
+# so using one provider does not import the other provider's SDK.
+_LAZY_IMPORTS = {
+    "GenericGemini": "generic_llm_lib.llm_impl.gemini",
+    "GeminiToolRegistry": "generic_llm_lib.llm_impl.gemini",
+    "GenericOpenAI": "generic_llm_lib.llm_impl.openai_api",
+    "OpenAIToolRegistry": "generic_llm_lib.llm_impl.openai_api",
+}
 
 __all__ = [
     "GenericGemini",
@@ -9,3 +18,16 @@ __all__ = [
     "GenericOpenAI",
     "OpenAIToolRegistry",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Resolves lazily exported provider classes on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name), name)
+
+
+def __dir__() -> list[str]:
+    """Includes lazily exported names in introspection."""
+    return sorted(__all__)
@@ -31,6 +31,14 @@ class GeminiToolAdapter(ToolAdapter):
         """
         self.chat_session = chat_session
 
+    def reset(self, chat_session: Any) -> None:
+        """Rebinds the adapter to a new chat session for reuse.
+
+        Args:
+            chat_session: The Gemini chat session instance used to send messages.
+        """
+        self.chat_session = chat_session
+
     def get_tool_calls(self, response: GenerateContentResponse) -> Sequence[ToolCallRequest]:
         """Extract tool calls from a Gemini content response.
 
@@ -40,13 +48,15 @@ class GeminiToolAdapter(ToolAdapter):
         Returns:
             A sequence of tool call requests extracted from the response.
         """
-        function_calls = [p.function_call for p in (response.parts or []) if p.function_call]
+        # Single pass over the parts: the walrus keeps the function_call
+        # attribute read to one per part and skips the intermediate list.
         return [
             ToolCallRequest(
-                name=cast(str, function_call.name),
-                arguments=getattr(function_call, "args", None),
+                name=cast(str, fc.name),
+                arguments=getattr(fc, "args", None),
             )
-            for function_call in function_calls
+            for p in (response.parts or ())
+            if (fc := p.function_call) is not None
         ]
 
     def record_assistant_message(self, response: GenerateContentResponse) -> None:
@@ -8,13 +8,13 @@ and automatic tool execution loops.
 """
 
 from google.genai import types
-from typing import List, Tuple, Optional, Any, Sequence
+from typing import AsyncIterator, List, MutableMapping, Tuple, Type, Optional, Any, Sequence
 
 from google.genai.client import AsyncClient
 from google.genai.types import GenerateContentResponse
 from generic_llm_lib.llm_core import GenericLLM, get_logger
 from generic_llm_lib.llm_core.tools import ToolExecutionLoop
-from generic_llm_lib.llm_core.messages import BaseMessage
+from generic_llm_lib.llm_core.messages import AssistantMessage, BaseMessage, UserMessage
 from generic_llm_lib.llm_core.base import ChatResult
 from .adapter import GeminiToolAdapter
 from .registry import GeminiToolRegistry
@@ -41,6 +41,12 @@ class GenericGemini(GenericLLM[GenerateContentResponse]):
         max_function_loops: int = 5,
         tool_timeout: float = 180.0,
         tool_manager: Optional[ToolManager[GeminiToolRegistry]] = None,
+        *,
+        response_cache: Optional[MutableMapping[str, ChatResult[GenerateContentResponse]]] = None,
+        retryable_errors: Optional[Tuple[Type[BaseException], ...]] = None,
+        max_retry_delay: float = 30.0,
+        requests_per_minute: Optional[float] = None,
+        rate_limit_burst: int = 1,
     ):
         """
         Initializes the GenericGemini LLM wrapper.
@@ -54,9 +60,26 @@ class GenericGemini(GenericLLM[GenerateContentResponse]):
             max_tokens: The maximum number of tokens to generate in the response.
             max_function_loops: The maximum number of consecutive function calls the LLM can make.
             tool_timeout: The maximum time in seconds to wait for a tool execution.
+            response_cache: Optional mapping caching ChatResults keyed by
+                (model, system instruction, history, prompt); repeated turns
+                return without a billed API round-trip.
+            retryable_errors: Optional tuple of exception types that should
+                be retried; any other exception fails immediately.
+            max_retry_delay: Upper bound in seconds for a single backoff sleep.
+            requests_per_minute: Optional sustained request-rate cap; see
+                `GenericLLM.__init__`.
+            rate_limit_burst: Burst size for the rate limiter; see
+                `GenericLLM.__init__`.
         """
-        super().__init__()
+        super().__init__(
+            response_cache=response_cache,
+            retryable_errors=retryable_errors,
+            max_retry_delay=max_retry_delay,
+            requests_per_minute=requests_per_minute,
+            rate_limit_burst=rate_limit_burst,
+        )
         self.model: str = model_name
+        self.sys_instruction: str = sys_instruction
 
         self.max_function_loops = max_function_loops
         self.tool_timeout = tool_timeout
@@ -89,6 +112,16 @@ class GenericGemini(GenericLLM[GenerateContentResponse]):
         )
 
         self.client: AsyncClient = aclient
+        # Last chat session and the generic history it has already absorbed.
+        # Passing a ChatResult.history back into chat() matches this snapshot
+        # and reuses the session, so only the new prompt is appended instead
+        # of converting and re-seeding the whole history each turn.
+        self._last_session: Optional[Any] = None
+        self._last_session_history: Optional[List[BaseMessage]] = None
+        # One adapter reused across sequential turns; concurrent turns (e.g.
+        # batch_ask) fall back to a fresh instance while it is busy.
+        self._adapter = GeminiToolAdapter(None)
+        self._adapter_busy = False
         logger.info(f"Initialized GenericGemini with model='{model_name}', temp={temp}, max_tokens={max_tokens}")
 
     async def _chat_impl(self, history: List[BaseMessage], user_prompt: str) -> ChatResult[GenerateContentResponse]:
@@ -105,15 +138,40 @@ class GenericGemini(GenericLLM[GenerateContentResponse]):
         """
         logger.debug(f"Starting chat turn. History length: {len(history)}. Prompt: {user_prompt[:50]}...")
 
-        # Convert generic history to Gemini specific history
-        gemini_history = convert_to_gemini_history(history)
+        # Stateless ask without tools: call the model directly instead of
+        # allocating a chat session and running the function-call loop.
+        if not history and not self.registry.tools:
+            response = await self.client.models.generate_content(
+                model=self.model, contents=user_prompt, config=self.config
+            )
+            text = "".join([p.text for p in response.parts if p.text]) if response.parts else ""
+            return ChatResult(
+                content=text,
+                history=[UserMessage(content=user_prompt), AssistantMessage(content=text)],
+                raw=response,
+            )
+
+        if self._last_session is not None and history == self._last_session_history:
+            # The caller continued from the previous turn's history; the live
+            # session already contains it, so skip conversion and re-creation.
+            # Claim-and-clear: concurrent turns with value-equal histories
+            # (e.g. batch_ask over a shared prefix) must not send into the
+            # same live session, so only the first taker gets it and the
+            # rest create their own below. The winner re-publishes after
+            # the turn completes.
+            chat = self._last_session
+            self._last_session = None
+            self._last_session_history = None
+        else:
+            # Convert generic history to Gemini specific history
+            gemini_history = convert_to_gemini_history(history)
 
-        # Create a chat session with the provided history
-        chat = self.client.chats.create(
-            model=self.model,
-            config=self.config,
-            history=gemini_history,  # type: ignore[arg-type]
-        )
+            # Create a chat session with the provided history
+            chat = self.client.chats.create(
+                model=self.model,
+                config=self.config,
+                history=gemini_history,  # type: ignore[arg-type]
+            )
 
         # Send the user message
         try:
@@ -127,7 +185,35 @@ class GenericGemini(GenericLLM[GenerateContentResponse]):
         # Get full history from the chat session
         full_history = chat.get_history()
 
-        return self._build_response(response, full_history)
+        result = self._build_response(response, full_history)
+        self._last_session = chat
+        self._last_session_history = list(result.history)
+        return result
+
+    async def chat_stream(self, history: List[BaseMessage], user_prompt: str) -> AsyncIterator[str]:
+        """
+        Streams the model's reply for one chat turn as incremental text deltas.
+
+        Latency to the first token is a fraction of the full generation time,
+        which matters for interactive use. Tool execution is not run on this
+        path; use `chat()` when registered tools should be callable.
+
+        Args:
+            history: A list of `BaseMessage` objects representing the conversation history.
+            user_prompt: The current message from the user.
+
+        Yields:
+            Text fragments of the model's reply, in order.
+        """
+        gemini_history = convert_to_gemini_history(history)
+        chat = self.client.chats.create(
+            model=self.model,
+            config=self.config,
+            history=gemini_history,  # type: ignore[arg-type]
+        )
+        async for chunk in await chat.send_message_stream(user_prompt):
+            if chunk.text:
+                yield chunk.text
 
     async def _handle_function_calls(
         self, response: GenerateContentResponse, chat: Any
@@ -145,8 +231,26 @@ class GenericGemini(GenericLLM[GenerateContentResponse]):
         if not response:
             return response, chat
 
-        adapter = GeminiToolAdapter(chat)
-        result = await self._tool_loop.run(initial_response=response, adapter=adapter)
+        # Toolless chats (the common case) cannot contain function calls, so
+        # skip the adapter and loop coroutine entirely. The live registry is
+        # checked rather than a flag frozen at init so tools loaded
+        # dynamically mid-conversation still take the full path.
+        if not self.registry.tools:
+            return response, chat
+
+        if self._adapter_busy:
+            adapter = GeminiToolAdapter(chat)
+            reusing = False
+        else:
+            adapter = self._adapter
+            adapter.reset(chat)
+            self._adapter_busy = True
+            reusing = True
+        try:
+            result = await self._tool_loop.run(initial_response=response, adapter=adapter)
+        finally:
+            if reusing:
+                self._adapter_busy = False
 
         if not isinstance(result, GenerateContentResponse):
             raise TypeError(f"Expected GenerateContentResponse, got {type(result)}")
@@ -167,9 +271,17 @@ class GenericGemini(GenericLLM[GenerateContentResponse]):
         Returns:
             ChatResult[GenerateContentResponse]: The structured response.
         """
-        text_response = "".join([p.text for p in response.parts if p.text]) if response.parts else ""
         generic_history = convert_from_gemini_history(history)
 
+        # The final model turn is already materialized at the tail of the
+        # converted history; reuse its text instead of walking response.parts
+        # a second time. The join over the raw parts stays as a fallback.
+        last = generic_history[-1] if generic_history else None
+        if isinstance(last, AssistantMessage) and last.content:
+            text_response = last.content
+        else:
+            text_response = "".join([p.text for p in response.parts if p.text]) if response.parts else ""
+
         return ChatResult(
             content=text_response,
             history=generic_history,
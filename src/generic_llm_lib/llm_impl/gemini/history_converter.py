@@ -8,7 +8,7 @@ the conversion process into small, single-responsibility functions to ensure
 low cyclomatic complexity (Rank A) and high maintainability.
 """
 
-from typing import List, Sequence, Optional, Union
+from typing import Any, Callable, Dict, List, Sequence, Optional, Union
 from google.genai import types
 
 from generic_llm_lib.llm_core.messages import (
@@ -50,16 +50,19 @@ def _convert_tool_message(msg: ToolMessage) -> types.Content:
     return types.Content(role="user", parts=[part])
 
 
-def _convert_single_message_to_gemini(msg: BaseMessage) -> Optional[types.Content]:
-    """Dispatches a single message to the appropriate conversion function."""
-    if isinstance(msg, UserMessage):
-        return types.Content(role="user", parts=[types.Part(text=msg.content)])
-    if isinstance(msg, AssistantMessage):
-        return _convert_assistant_message(msg)
-    if isinstance(msg, ToolMessage):
-        return _convert_tool_message(msg)
-    # SystemMessage is ignored in history
-    return None
+def _convert_user_message(msg: UserMessage) -> types.Content:
+    """Converts a generic UserMessage to a Gemini Content object."""
+    return types.Content(role="user", parts=[types.Part(text=msg.content)])
+
+
+# Dispatch table keyed on the concrete message type: one dict lookup per
+# message instead of an isinstance ladder. SystemMessage (and anything else
+# unknown) has no entry and is skipped.
+_TO_GEMINI: Dict[type, Callable[[Any], types.Content]] = {
+    UserMessage: _convert_user_message,
+    AssistantMessage: _convert_assistant_message,
+    ToolMessage: _convert_tool_message,
+}
 
 
 def convert_to_gemini_history(history: List[BaseMessage]) -> List[types.Content]:
@@ -71,12 +74,7 @@ def convert_to_gemini_history(history: List[BaseMessage]) -> List[types.Content]
     Returns:
         A list of Gemini Content objects.
     """
-    gemini_history = []
-    for msg in history:
-        converted = _convert_single_message_to_gemini(msg)
-        if converted:
-            gemini_history.append(converted)
-    return gemini_history
+    return [builder(msg) for msg in history if (builder := _TO_GEMINI.get(type(msg))) is not None]
 
 
 # --- Conversion FROM Gemini format ---
@@ -96,20 +94,6 @@ def _create_tool_message_from_response(tr: types.FunctionResponse) -> ToolMessag
     )
 
 
-def _extract_tool_responses(parts: List[types.Part]) -> List[ToolMessage]:
-    """Extracts tool responses from a list of Gemini Parts."""
-    tool_responses = [p.function_response for p in parts if p.function_response]
-    return [_create_tool_message_from_response(tr) for tr in tool_responses]
-
-
-def _extract_user_text_message(parts: List[types.Part]) -> List[UserMessage]:
-    """Extracts a user text message from a list of Gemini Parts."""
-    text_parts = [p.text for p in parts if p.text]
-    if text_parts:
-        return [UserMessage(content="".join(text_parts))]
-    return []
-
-
 def _convert_gemini_user_role(content: types.Content) -> List[BaseMessage]:
     """Converts a Gemini 'user' role Content object to generic messages.
 
@@ -118,24 +102,24 @@ def _convert_gemini_user_role(content: types.Content) -> List[BaseMessage]:
     if not content.parts:
         return []
 
+    # One pass over the parts collects both candidate shapes; the two helper
+    # scans would each walk the list again for the common single-kind case.
+    tool_responses: List[types.FunctionResponse] = []
+    text_parts: List[str] = []
+    for p in content.parts:
+        if p.function_response:
+            tool_responses.append(p.function_response)
+        elif p.text:
+            text_parts.append(p.text)
+
     # Case 1: Tool Responses
-    tool_messages = _extract_tool_responses(content.parts)
-    if tool_messages:
-        return tool_messages  # type: ignore[return-value]
+    if tool_responses:
+        return [_create_tool_message_from_response(tr) for tr in tool_responses]  # type: ignore[return-value]
 
     # Case 2: User Text
-    return _extract_user_text_message(content.parts)  # type: ignore[return-value]
-
-
-def _extract_model_text(parts: List[types.Part]) -> str:
-    """Extracts text content from model parts."""
-    return "".join([p.text for p in parts if p.text])
-
-
-def _extract_model_tool_calls(parts: List[types.Part]) -> Optional[List[types.FunctionCall]]:
-    """Extracts tool calls from model parts."""
-    tool_calls = [p.function_call for p in parts if p.function_call]
-    return tool_calls if tool_calls else None
+    if text_parts:
+        return [UserMessage(content="".join(text_parts))]  # type: ignore[return-value]
+    return []
 
 
 def _convert_gemini_model_role(content: types.Content) -> Optional[AssistantMessage]:
@@ -143,17 +127,37 @@ def _convert_gemini_model_role(content: types.Content) -> Optional[AssistantMess
     if not content.parts:
         return None
 
-    text_content = _extract_model_text(content.parts)
-    tool_calls = _extract_model_tool_calls(content.parts)
-
-    if text_content or tool_calls:
+    # Single pass: text fragments and tool calls are picked up together, and
+    # an all-empty Content bails out without building the message at all.
+    text_parts: List[str] = []
+    tool_calls: List[types.FunctionCall] = []
+    for p in content.parts:
+        if p.text:
+            text_parts.append(p.text)
+        if p.function_call:
+            tool_calls.append(p.function_call)
+
+    if text_parts or tool_calls:
         return AssistantMessage(
-            content=text_content,
-            tool_calls=tool_calls,  # type: ignore[arg-type]
+            content="".join(text_parts),
+            tool_calls=tool_calls or None,  # type: ignore[arg-type]
         )
     return None
 
 
+def _convert_gemini_model_role_messages(content: types.Content) -> List[BaseMessage]:
+    """Wraps the model-role conversion into the common list-of-messages shape."""
+    msg = _convert_gemini_model_role(content)
+    return [msg] if msg else []
+
+
+# Role-keyed counterpart of _TO_GEMINI for the reverse direction.
+_FROM_GEMINI: Dict[str, Callable[[types.Content], List[BaseMessage]]] = {
+    "user": _convert_gemini_user_role,
+    "model": _convert_gemini_model_role_messages,
+}
+
+
 def convert_from_gemini_history(history: Sequence[types.Content]) -> List[BaseMessage]:
     """Converts a Gemini-specific message history back to the generic format.
 
@@ -165,10 +169,7 @@ def convert_from_gemini_history(history: Sequence[types.Content]) -> List[BaseMe
     """
     generic_history: List[BaseMessage] = []
     for content in history:
-        if content.role == "user":
-            generic_history.extend(_convert_gemini_user_role(content))
-        elif content.role == "model":
-            msg = _convert_gemini_model_role(content)
-            if msg:
-                generic_history.append(msg)
+        handler = _FROM_GEMINI.get(content.role) if content.role else None
+        if handler is not None:
+            generic_history.extend(handler(content))
     return generic_history
@@ -10,7 +10,7 @@ format required by the Google GenAI SDK, including schema sanitization.
 from google.genai import types
 from generic_llm_lib.llm_core import ToolRegistry, ToolDefinition
 from . import schema_sanitizer
-from typing import Callable, Dict, Any, Union, Optional
+from typing import Callable, Any, Dict, Union, Optional
 
 
 class GeminiToolRegistry(ToolRegistry):
@@ -25,6 +25,15 @@ class GeminiToolRegistry(ToolRegistry):
     def __init__(self) -> None:
         """Initialize the GeminiToolRegistry."""
         super().__init__()
+        # tool_object rebuilds a FunctionDeclaration (plus schema sanitize)
+        # per tool; the result is cached until the registry contents change.
+        self._tool_object_cache: Optional[types.Tool] = None
+        self._tools_version = 0
+        self._cached_version = -1
+        # Declarations are built (and schemas sanitized) once at registration
+        # instead of on every tool_object access. Stored per registry so the
+        # shared ToolDefinition objects are never mutated.
+        self._declarations: Dict[str, types.FunctionDeclaration] = {}
 
     def register(
         self,
@@ -48,6 +57,30 @@ class GeminiToolRegistry(ToolRegistry):
             parameters: A dictionary or types.Schema defining the tool's input parameters. Required if `name_or_tool` is a string.
         """
         super().register(name_or_tool, description, func, parameters)
+        for name, tool in self.tools.items():
+            if name not in self._declarations:
+                self._declarations[name] = self._build_declaration(tool)
+        self._tools_version += 1
+
+    def unregister(self, tool_name: str) -> None:
+        """Unregisters a tool and invalidates the cached tool object.
+
+        Args:
+            tool_name: The name of the tool to remove.
+        """
+        super().unregister(tool_name)
+        self._declarations.pop(tool_name, None)
+        self._tools_version += 1
+
+    @staticmethod
+    def _build_declaration(tool: ToolDefinition) -> types.FunctionDeclaration:
+        """Builds the Gemini function declaration for one registered tool."""
+        if tool.parameters:
+            sanitized_schema = schema_sanitizer.sanitize(tool.parameters)
+            return types.FunctionDeclaration(
+                name=tool.name, description=tool.description, parameters=types.Schema(**sanitized_schema)
+            )
+        return types.FunctionDeclaration(name=tool.name, description=tool.description)
 
     @property
     def tool_object(self) -> types.Tool | None:
@@ -59,29 +92,16 @@ class GeminiToolRegistry(ToolRegistry):
             A `types.Tool` object containing all registered function declarations,
             or None if no tools are registered.
         """
+        if self._cached_version == self._tools_version:
+            return self._tool_object_cache
+
         if not self.tools:
+            self._tool_object_cache = None
+            self._cached_version = self._tools_version
             return None
 
-        declarations = []
-        for tool in self.tools.values():
-            if tool.parameters:
-                sanitized_schema = schema_sanitizer.sanitize(tool.parameters)
-                parameter_schema = types.Schema(**sanitized_schema)
-                declarations.append(
-                    types.FunctionDeclaration(name=tool.name, description=tool.description, parameters=parameter_schema)
-                )
-            else:
-                declarations.append(types.FunctionDeclaration(name=tool.name, description=tool.description))
-
-        return types.Tool(function_declarations=declarations)
-
-    @property
-    def implementations(self) -> Dict[str, Callable]:
-        """
-        Returns a dictionary mapping tool names to their callable implementations.
-
-        Returns:
-            A dictionary where keys are tool names and values are the corresponding
-            callable functions.
-        """
-        return {name: tool.func for name, tool in self.tools.items()}
+        # Declarations were prepared at registration; this is a list build.
+        tool_object = types.Tool(function_declarations=list(self._declarations.values()))
+        self._tool_object_cache = tool_object
+        self._cached_version = self._tools_version
+        return tool_object
@@ -7,9 +7,10 @@ the interaction with the OpenAI API, including chat history management
 and automatic tool execution loops.
 """
 
-from openai import AsyncOpenAI
-from openai.types.chat import ChatCompletion, ChatCompletionToolParam
-from typing import List, Tuple, Optional, Any, Dict, Iterable, cast
+import httpx
+from openai import AsyncOpenAI, AsyncStream
+from openai.types.chat import ChatCompletion, ChatCompletionChunk, ChatCompletionToolParam
+from typing import AsyncIterator, List, MutableMapping, Tuple, Type, Optional, Any, Dict, Iterable, cast
 import logging
 from generic_llm_lib.llm_core import GenericLLM
 from generic_llm_lib.llm_core.tools import ToolExecutionLoop, ToolManager
@@ -39,6 +40,12 @@ class GenericOpenAI(GenericLLM[ChatCompletion]):
         max_function_loops: int = 5,
         tool_timeout: float = 180.0,
         tool_manager: Optional[ToolManager[OpenAIToolRegistry]] = None,
+        *,
+        response_cache: Optional[MutableMapping[str, ChatResult[ChatCompletion]]] = None,
+        retryable_errors: Optional[Tuple[Type[BaseException], ...]] = None,
+        max_retry_delay: float = 30.0,
+        requests_per_minute: Optional[float] = None,
+        rate_limit_burst: int = 1,
     ):
         """
         Initializes the GenericOpenAI LLM wrapper.
@@ -52,8 +59,26 @@ class GenericOpenAI(GenericLLM[ChatCompletion]):
             max_tokens: The maximum number of tokens to generate in the response.
             max_function_loops: The maximum number of consecutive function calls the LLM can make.
             tool_timeout: The maximum time in seconds to wait for a tool execution.
+            response_cache: Optional mapping caching ChatResults keyed by
+                (model, system instruction, history, prompt); repeated turns
+                return without a billed API round-trip. Best combined with
+                temperature 0 so cached replies match what the model would
+                have produced.
+            retryable_errors: Optional tuple of exception types that should
+                be retried; any other exception fails immediately.
+            max_retry_delay: Upper bound in seconds for a single backoff sleep.
+            requests_per_minute: Optional sustained request-rate cap; see
+                `GenericLLM.__init__`.
+            rate_limit_burst: Burst size for the rate limiter; see
+                `GenericLLM.__init__`.
         """
-        super().__init__()
+        super().__init__(
+            response_cache=response_cache,
+            retryable_errors=retryable_errors,
+            max_retry_delay=max_retry_delay,
+            requests_per_minute=requests_per_minute,
+            rate_limit_burst=rate_limit_burst,
+        )
         self.model: str = model_name
         self.registry: Optional[OpenAIToolRegistry] | None = registry
         self.max_function_loops = max_function_loops
@@ -65,6 +90,13 @@ class GenericOpenAI(GenericLLM[ChatCompletion]):
 
         self.tool_manager = tool_manager
 
+        # Built once and shared across turns (never mutated downstream), so
+        # the request prefix stays byte-identical call to call — a
+        # precondition for the provider's server-side prompt caching.
+        self._sys_msg: Optional[Dict[str, Any]] = (
+            {"role": "system", "content": sys_instruction} if sys_instruction else None
+        )
+
         if registry:
             self.registry = registry
         elif self.tool_manager:
@@ -80,13 +112,92 @@ class GenericOpenAI(GenericLLM[ChatCompletion]):
             argument_error_formatter=self._format_argument_error,
         )
 
+        # One adapter reused across sequential turns; concurrent turns (e.g.
+        # batch_ask) fall back to a fresh instance while it is busy.
+        self._adapter = OpenAIToolAdapter(
+            client=self.client,
+            model=self.model,
+            messages=[],
+            registry=self.registry,
+            temperature=self.temperature,
+            max_tokens=self.max_tokens,
+        )
+        self._adapter_busy = False
+
+        # Last turn's OpenAI-format messages and the generic history they
+        # correspond to. Passing a ChatResult.history back into chat()
+        # matches this snapshot and reuses the converted dicts, so only the
+        # new prompt is appended instead of re-converting the whole history
+        # each turn.
+        self._last_messages: Optional[List[Dict[str, Any]]] = None
+        self._last_history: Optional[List[BaseMessage]] = None
+
+    @classmethod
+    def from_config(
+        cls,
+        api_key: str,
+        model_name: str,
+        sys_instruction: str,
+        base_url: Optional[str] = None,
+        **kwargs: Any,
+    ) -> "GenericOpenAI":
+        """Builds a GenericOpenAI with a connection-pooled HTTP transport.
+
+        A keepalive pool lets sequential `ask()`/`chat()` calls — and every
+        follow-up request inside the tool loop — reuse the same TCP+TLS
+        connection instead of paying a fresh handshake per request. Callers
+        constructing their own `AsyncOpenAI` client should configure
+        comparable `httpx.Limits` to get the same behavior, and should use
+        `close()` when done so the pool lives as long as this object.
+
+        Args:
+            api_key: The OpenAI API key.
+            model_name: The identifier for the OpenAI model to use.
+            sys_instruction: A system-level instruction or persona for the LLM.
+            base_url: Optional API base URL override (e.g. for proxies).
+            **kwargs: Forwarded to `__init__` (registry, temp, max_tokens, ...).
+
+        Returns:
+            A configured GenericOpenAI instance owning its HTTP client.
+        """
+        limits = httpx.Limits(max_keepalive_connections=20, max_connections=100, keepalive_expiry=30.0)
+        timeout = httpx.Timeout(60.0, connect=10.0)
+        try:
+            http_client = httpx.AsyncClient(http2=True, limits=limits, timeout=timeout)
+        except ImportError:
+            # httpx's h2 extra is not installed; HTTP/1.1 keepalive still
+            # gives the pooling win.
+            http_client = httpx.AsyncClient(limits=limits, timeout=timeout)
+
+        # Some openai releases annotate http_client with a vendored httpx
+        # module, so the stub type differs across versions even though any
+        # httpx.AsyncClient works at runtime; cast keeps the check portable.
+        client = AsyncOpenAI(api_key=api_key, base_url=base_url, http_client=cast(Any, http_client))
+        return cls(client=client, model_name=model_name, sys_instruction=sys_instruction, **kwargs)
+
+    async def close(self) -> None:
+        """Closes the underlying OpenAI client and its connection pool."""
+        await self.client.close()
+
     def _prepare_messages(self, history: List[BaseMessage], user_prompt: str) -> List[Dict[str, Any]]:
         """Prepares the initial list of messages for the OpenAI API call."""
-        openai_history = convert_to_openai_history(history)
-        messages = list(openai_history)
-
-        if not messages and self.sys_instruction:
-            messages.append({"role": "system", "content": self.sys_instruction})
+        if self._last_messages is not None and history == self._last_history:
+            # The caller continued from the previous turn's history; reuse
+            # its already-converted dicts (copied, since the list grows over
+            # the turn) instead of walking the generic history again.
+            messages = list(self._last_messages)
+        else:
+            # convert_to_openai_history already returns a fresh list; append
+            # to it directly instead of copying it a second time.
+            messages = convert_to_openai_history(history)
+
+        # The system message leads every request — not just the first turn —
+        # so mid-session calls keep the instruction and the prefix matches
+        # the previous turn's bytes for server-side prompt-cache hits.
+        # Histories that already carry a system message (e.g. round-tripped
+        # through HistoryHandler) are left as-is to avoid duplicates.
+        if self._sys_msg is not None and (not messages or messages[0].get("role") != "system"):
+            messages.insert(0, self._sys_msg)
 
         messages.append({"role": "user", "content": user_prompt})
         return messages
@@ -113,10 +224,16 @@ class GenericOpenAI(GenericLLM[ChatCompletion]):
     def _append_final_response_to_messages(messages: List[Dict[str, Any]], final_response: ChatCompletion) -> None:
         """Appends the final LLM response to the messages list if it contains content."""
         if final_response.choices and final_response.choices[0].message.content:
-            last_msg = final_response.choices[0].message.model_dump()
-            # Avoid duplicates if the message is already present (e.g., from tool loop)
-            if not messages or messages[-1] != last_msg:
-                messages.append(last_msg)
+            message = final_response.choices[0].message
+            # Avoid duplicates if the message is already present (e.g., from
+            # the tool loop). Comparing role and content is enough to catch
+            # that case and skips both the deep dict comparison and the
+            # model_dump of an already-recorded message.
+            if messages:
+                last = messages[-1]
+                if last.get("role") == "assistant" and last.get("content") == message.content:
+                    return
+            messages.append(message.model_dump())
 
     async def _chat_impl(self, history: List[BaseMessage], user_prompt: str) -> ChatResult[ChatCompletion]:
         """
@@ -146,7 +263,7 @@ class GenericOpenAI(GenericLLM[ChatCompletion]):
         logger.debug(f"Sending initial request to OpenAI model: {self.model}")
         response = await self.client.chat.completions.create(
             model=self.model,
-            messages=cast(Iterable[Any], messages),
+            messages=messages,  # type: ignore[arg-type]
             tools=tools,  # type: ignore
             temperature=self.temperature,
             max_tokens=self.max_tokens,
@@ -158,7 +275,42 @@ class GenericOpenAI(GenericLLM[ChatCompletion]):
 
         self._append_final_response_to_messages(messages, final_response)
 
-        return self._build_response(final_response, messages)
+        result = self._build_response(final_response, messages)
+        self._last_messages = messages
+        self._last_history = list(result.history)
+        return result
+
+    async def chat_stream(self, history: List[BaseMessage], user_prompt: str) -> AsyncIterator[str]:
+        """
+        Streams the model's reply for one chat turn as incremental text deltas.
+
+        Latency to the first token is a fraction of the full generation time,
+        which matters for interactive use. Tool execution is not run on this
+        path; use `chat()` when registered tools should be callable.
+
+        Args:
+            history: A list of `BaseMessage` objects representing the conversation history.
+            user_prompt: The current message from the user.
+
+        Yields:
+            Text fragments of the model's reply, in order.
+        """
+        messages = self._prepare_messages(history, user_prompt)
+        # create() is typed as the non-streaming/streaming union; stream=True
+        # guarantees the streaming variant, so narrow it for the iteration.
+        stream = cast(
+            AsyncStream[ChatCompletionChunk],
+            await self.client.chat.completions.create(
+                model=self.model,
+                messages=messages,  # type: ignore[arg-type]
+                temperature=self.temperature,
+                max_tokens=self.max_tokens,
+                stream=True,
+            ),
+        )
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
 
     async def _handle_function_calls(
         self,
@@ -181,16 +333,28 @@ class GenericOpenAI(GenericLLM[ChatCompletion]):
         if not initial_response.choices:
             return messages, initial_response
 
-        adapter = OpenAIToolAdapter(
-            client=self.client,
-            model=self.model,
-            messages=messages,
-            registry=self.registry,
-            temperature=self.temperature,
-            max_tokens=self.max_tokens,
-        )
-
-        final_response: ChatCompletion = await self._tool_loop.run(initial_response=initial_response, adapter=adapter)
+        if self._adapter_busy:
+            adapter = OpenAIToolAdapter(
+                client=self.client,
+                model=self.model,
+                messages=messages,
+                registry=self.registry,
+                temperature=self.temperature,
+                max_tokens=self.max_tokens,
+            )
+            reusing = False
+        else:
+            adapter = self._adapter
+            adapter.reset(messages)
+            self._adapter_busy = True
+            reusing = True
+        try:
+            final_response: ChatCompletion = await self._tool_loop.run(
+                initial_response=initial_response, adapter=adapter
+            )
+        finally:
+            if reusing:
+                self._adapter_busy = False
 
         return messages, final_response
 
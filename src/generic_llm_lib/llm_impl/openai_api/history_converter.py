@@ -7,7 +7,7 @@ class and ensuring that all conversion functions have low cyclomatic complexity
 (Rank A) for high maintainability.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import Callable, List, Dict, Any, Optional
 
 from generic_llm_lib.llm_core.messages import (
     BaseMessage,
@@ -50,17 +50,21 @@ def _convert_tool_message(msg: ToolMessage) -> Dict[str, Any]:
     }
 
 
+# Dispatch table keyed on the concrete message type: one dict lookup per
+# message instead of a four-way isinstance chain. Unknown subclasses have no
+# entry and are skipped.
+_TO_OPENAI: Dict[type, Callable[[Any], Dict[str, Any]]] = {
+    UserMessage: _convert_user_message,
+    AssistantMessage: _convert_assistant_message,
+    SystemMessage: _convert_system_message,
+    ToolMessage: _convert_tool_message,
+}
+
+
 def _convert_single_message_to_openai(msg: BaseMessage) -> Optional[Dict[str, Any]]:
     """Dispatches a single generic message to the appropriate OpenAI conversion function."""
-    if isinstance(msg, UserMessage):
-        return _convert_user_message(msg)
-    if isinstance(msg, AssistantMessage):
-        return _convert_assistant_message(msg)
-    if isinstance(msg, SystemMessage):
-        return _convert_system_message(msg)
-    if isinstance(msg, ToolMessage):
-        return _convert_tool_message(msg)
-    return None
+    builder = _TO_OPENAI.get(type(msg))
+    return builder(msg) if builder is not None else None
 
 
 def convert_to_openai_history(history: List[BaseMessage]) -> List[Dict[str, Any]]:
@@ -72,12 +76,7 @@ def convert_to_openai_history(history: List[BaseMessage]) -> List[Dict[str, Any]
     Returns:
         A list of message dictionaries compatible with the OpenAI API.
     """
-    openai_history = []
-    for msg in history:
-        converted_msg = _convert_single_message_to_openai(msg)
-        if converted_msg:
-            openai_history.append(converted_msg)
-    return openai_history
+    return [builder(msg) for msg in history if (builder := _TO_OPENAI.get(type(msg))) is not None]
 
 
 # --- Conversion FROM OpenAI format ---
@@ -120,18 +119,19 @@ def _convert_openai_tool_role(msg: Dict[str, Any]) -> Optional[ToolMessage]:
     return None
 
 
+# Role-keyed counterpart of _TO_OPENAI for the reverse direction.
+_FROM_OPENAI: Dict[str, Callable[[Dict[str, Any]], Optional[BaseMessage]]] = {
+    "user": _convert_openai_user_role,
+    "assistant": _convert_openai_assistant_role,
+    "system": _convert_openai_system_role,
+    "tool": _convert_openai_tool_role,
+}
+
+
 def _convert_single_message_from_openai(msg: Dict[str, Any]) -> Optional[BaseMessage]:
     """Dispatches a single OpenAI message dictionary to the appropriate generic conversion function."""
-    role = msg.get("role")
-    if role == "user":
-        return _convert_openai_user_role(msg)
-    if role == "assistant":
-        return _convert_openai_assistant_role(msg)
-    if role == "system":
-        return _convert_openai_system_role(msg)
-    if role == "tool":
-        return _convert_openai_tool_role(msg)
-    return None
+    handler = _FROM_OPENAI.get(msg.get("role", ""))
+    return handler(msg) if handler is not None else None
 
 
 def convert_from_openai_history(history: List[Dict[str, Any]]) -> List[BaseMessage]:
@@ -145,7 +145,9 @@ def convert_from_openai_history(history: List[Dict[str, Any]]) -> List[BaseMessa
     """
     generic_history: List[BaseMessage] = []
     for msg in history:
-        converted_msg = _convert_single_message_from_openai(msg)
-        if converted_msg:
-            generic_history.append(converted_msg)
+        handler = _FROM_OPENAI.get(msg.get("role", ""))
+        if handler is not None:
+            converted_msg = handler(msg)
+            if converted_msg:
+                generic_history.append(converted_msg)
     return generic_history
@@ -25,6 +25,11 @@ class OpenAIToolRegistry(ToolRegistry):
     def __init__(self) -> None:
         """Initialize the OpenAIToolRegistry."""
         super().__init__()
+        # tool_object rebuilds one function dict per tool on every access;
+        # the result is cached until the registry contents change.
+        self._tool_object_cache: Optional[Iterable[ChatCompletionFunctionToolParam]] = None
+        self._tools_version = 0
+        self._cached_version = -1
 
     def register(
         self,
@@ -48,6 +53,16 @@ class OpenAIToolRegistry(ToolRegistry):
             parameters: A dictionary defining the tool's input parameters (JSON Schema). Required if `name_or_tool` is a string.
         """
         super().register(name_or_tool, description, func, parameters)
+        self._tools_version += 1
+
+    def unregister(self, tool_name: str) -> None:
+        """Unregisters a tool and invalidates the cached tool object.
+
+        Args:
+            tool_name: The name of the tool to remove.
+        """
+        super().unregister(tool_name)
+        self._tools_version += 1
 
     @property
     def tool_object(self) -> Iterable[ChatCompletionFunctionToolParam] | None:
@@ -58,7 +73,12 @@ class OpenAIToolRegistry(ToolRegistry):
         Returns:
             A list of tool dictionaries, or None if no tools are registered.
         """
+        if self._cached_version == self._tools_version:
+            return self._tool_object_cache
+
         if not self.tools:
+            self._tool_object_cache = None
+            self._cached_version = self._tools_version
             return None
 
         tools_list = []
@@ -77,15 +97,7 @@ class OpenAIToolRegistry(ToolRegistry):
 
             tools_list.append({"type": "function", "function": function_def})
 
-        return cast(Iterable[ChatCompletionFunctionToolParam], tools_list)
-
-    @property
-    def implementations(self) -> Dict[str, Callable]:
-        """
-        Returns a dictionary mapping tool names to their callable implementations.
-
-        Returns:
-            A dictionary where keys are tool names and values are the corresponding
-            callable functions.
-        """
-        return {name: tool.func for name, tool in self.tools.items()}
+        tool_object = cast(Iterable[ChatCompletionFunctionToolParam], tools_list)
+        self._tool_object_cache = tool_object
+        self._cached_version = self._tools_version
+        return tool_object
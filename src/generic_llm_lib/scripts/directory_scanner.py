@@ -1,5 +1,7 @@
 """Scans a directory to create a filtered tree structure of its contents."""
 
+import json
+import os
 from pathlib import Path
 from typing import Any, Dict, Set, Union
 
@@ -8,6 +10,10 @@ from typing import Any, Dict, Set, Union
 # Project root is 4 levels up.
 PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent.parent
 
+# Precomputed indent prefixes shared by all formatting calls. Depths beyond
+# the table fall back to computing the prefix on the fly.
+_INDENTS = tuple("   " * i for i in range(64))
+
 
 class DirectoryScanner:
     """
@@ -49,7 +55,7 @@ class DirectoryScanner:
             "generic_llm_lib.egg-info",
         }
 
-    def read_directory_tree(self, path: Path = PROJECT_ROOT) -> Dict[str, Union[str, Dict[str, Any]]]:
+    def read_directory_tree(self, path: Union[str, Path] = PROJECT_ROOT) -> Dict[str, Union[str, Dict[str, Any]]]:
         """
         Walks a directory to create a dictionary from its filtered structure.
 
@@ -57,6 +63,10 @@ class DirectoryScanner:
         allowed extensions and skipping specified directories. This is useful
         for generating a clean overview of a project's source code.
 
+        It uses `os.scandir` so that the type and size of each entry come from
+        the metadata the directory listing already provides, instead of issuing
+        a separate `stat` call per entry as `Path.iterdir()` would.
+
         Args:
             path: The root path from which to start scanning.
 
@@ -66,71 +76,127 @@ class DirectoryScanner:
             represented as nested dictionaries. Returns an empty dictionary
             if the path is not a directory.
         """
-        if not path.is_dir():
+        if not os.path.isdir(path):
             return {}
 
         data: Dict[str, Union[str, Dict[str, Any]]] = {}
 
-        for item in sorted(path.iterdir()):  # Sort for consistent output
-            if item.name in self.excluded_dirs:
-                continue
+        # Explicit DFS stack instead of recursion: the directory counter is
+        # checked before each descent, so max_dirs_to_scan is a hard global
+        # bound on I/O no matter how deep the first subtree is.
+        stack: list[tuple[str, Dict[str, Union[str, Dict[str, Any]]]]] = [(os.fspath(path), data)]
+        # (parent_dict, name, child_dict) records for pruning empty directories.
+        inserted: list[tuple[Dict[str, Any], str, Dict[str, Any]]] = []
 
-            if item.is_dir():
-                if self.scanned_dirs_count >= self.max_dirs_to_scan:
-                    continue
-                self.scanned_dirs_count += 1
-                subtree = self.read_directory_tree(item)
-                if subtree:  # Only include non-empty directories
-                    data[item.name] = subtree
-            elif item.is_file() and item.suffix in self.allowed_extensions:
-                try:
-                    size_kb = item.stat().st_size / 1024
-                    data[item.name] = f"{size_kb:.2f}kb"
-                except FileNotFoundError:
-                    # This can happen with broken symlinks, so we skip them.
+        while stack:
+            current_path, current_data = stack.pop()
+            with os.scandir(current_path) as it:
+                entries = sorted(it, key=lambda e: e.name)  # Sort for consistent output
+
+            for entry in entries:
+                if entry.name in self.excluded_dirs:
                     continue
+
+                if entry.is_dir(follow_symlinks=False):
+                    if self.scanned_dirs_count >= self.max_dirs_to_scan:
+                        continue
+                    self.scanned_dirs_count += 1
+                    subtree: Dict[str, Union[str, Dict[str, Any]]] = {}
+                    current_data[entry.name] = subtree
+                    inserted.append((current_data, entry.name, subtree))
+                    # entry.path is already a joined string; no Path allocation needed.
+                    stack.append((entry.path, subtree))
+                elif (
+                    entry.is_file(follow_symlinks=False) and os.path.splitext(entry.name)[1] in self.allowed_extensions
+                ):
+                    try:
+                        size_kb = entry.stat(follow_symlinks=False).st_size / 1024
+                        current_data[entry.name] = f"{size_kb:.2f}kb"
+                    except FileNotFoundError:
+                        # This can happen with broken symlinks, so we skip them.
+                        continue
+
+        # Prune empty directories in reverse insertion order so that
+        # directories emptied by pruning their children are removed as well.
+        for parent, name, child in reversed(inserted):
+            if not child:
+                del parent[name]
+
         return data
 
     def json_tree_to_string(self, data: Dict[str, Any], indent: int = 0) -> str:
         """
         Converts a dictionary tree to a formatted string.
 
+        Lines are produced by an iterative depth-first walk and joined once at
+        the end, so formatting stays linear in the output size instead of the
+        quadratic cost of repeated string concatenation.
+
         Args:
             data: The dictionary tree to convert.
-            indent: The current indentation level for pretty-printing.
+            indent: The starting indentation level for pretty-printing.
 
         Returns:
             A string representation of the directory tree.
         """
-        content_string = ""
-        for key, value in data.items():
-            prefix = "   " * indent
+        table_size = len(_INDENTS)
+        lines = []
+        # Explicit DFS stack of (key, value, depth); reversed so dict order is preserved.
+        stack = [(key, value, indent) for key, value in reversed(data.items())]
+        while stack:
+            key, value, depth = stack.pop()
+            pad = _INDENTS[depth] if depth < table_size else "   " * depth
             if isinstance(value, dict):
-                content_string += f"{prefix}{key}/\n"
-                content_string += self.json_tree_to_string(value, indent + 1)
+                lines.append(f"{pad}{key}/\n")
+                stack.extend((k, v, depth + 1) for k, v in reversed(value.items()))
             else:
-                content_string += f"{prefix}{key}: {value}\n"
-        return content_string
+                lines.append(f"{pad}{key}: {value}\n")
+        return "".join(lines)
 
-    def build_directory_tree(self, data: Dict[str, Any], path: Path = PROJECT_ROOT) -> None:
+    @staticmethod
+    def load_tree_json(path: Union[str, Path]) -> Dict[str, Any]:
+        """
+        Loads a previously saved directory tree from a JSON file.
+
+        The file is read as raw bytes in one go and parsed directly, which
+        skips the text-mode decoding layer and the small default I/O buffer.
+
+        Args:
+            path: Path to the JSON file containing the tree.
+
+        Returns:
+            The parsed directory tree dictionary.
+        """
+        tree: Dict[str, Any] = json.loads(Path(path).read_bytes())
+        return tree
+
+    def build_directory_tree(self, data: Dict[str, Any], path: Union[str, Path] = PROJECT_ROOT) -> None:
         """
         Creates a directory structure from a dictionary.
 
+        Child paths are built with plain string joins and created through the
+        os-level calls directly, avoiding a Path parse/normalize per node.
+
         Note: This is a destructive operation and should be used with caution.
 
         Args:
             data: The dictionary representing the directory structure.
             path: The root path where the structure will be created.
         """
+        root = os.fspath(path)
         for key, value in data.items():
-            next_path = path / key
+            next_path = os.path.join(root, key)
             try:
                 if isinstance(value, dict):
-                    next_path.mkdir(parents=True, exist_ok=True)
+                    # exist_ok=True makes this a single mkdir syscall with no
+                    # preceding stat; an existing directory is not an error.
+                    os.makedirs(next_path, exist_ok=True)
                     print(f"Directory created at {next_path}")
                     self.build_directory_tree(value, next_path)
                 else:
-                    next_path.touch()
+                    # 'x' mode creates with O_EXCL, so the existence check
+                    # happens inside the same syscall as the create.
+                    open(next_path, "xb").close()
                     print(f"File created {next_path}")
             except FileExistsError:
                 print(f"File or directory already exists at {next_path}")
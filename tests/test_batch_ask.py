@@ -0,0 +1,49 @@
+"""Tests for GenericLLM.batch_ask concurrency fan-out."""
+
+import asyncio
+import pytest
+from typing import List
+
+from generic_llm_lib.llm_core.base import GenericLLM, ChatResult
+from generic_llm_lib.llm_core.messages import BaseMessage
+
+
+class MockLLM(GenericLLM[str]):
+    def __init__(self, **kwargs):
+        super().__init__(base_retry_delay=0.01, **kwargs)
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def _chat_impl(self, history: List[BaseMessage], user_prompt: str) -> ChatResult[str]:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        if user_prompt == "boom":
+            raise ValueError("bad prompt")
+        return ChatResult(content=f"echo: {user_prompt}", history=[], raw="raw")
+
+
+@pytest.mark.asyncio
+async def test_batch_ask_preserves_order():
+    llm = MockLLM(max_retries=0)
+    results = await llm.batch_ask(["a", "b", "c"])
+
+    assert [r.content for r in results] == ["echo: a", "echo: b", "echo: c"]
+
+
+@pytest.mark.asyncio
+async def test_batch_ask_respects_concurrency_limit():
+    llm = MockLLM(max_retries=0)
+    await llm.batch_ask([f"p{i}" for i in range(10)], max_concurrency=2)
+
+    assert llm.max_in_flight <= 2
+
+
+@pytest.mark.asyncio
+async def test_batch_ask_returns_exceptions_in_place():
+    llm = MockLLM(max_retries=0)
+    results = await llm.batch_ask(["ok", "boom"])
+
+    assert results[0].content == "echo: ok"
+    assert isinstance(results[1], ValueError)
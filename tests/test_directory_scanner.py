@@ -0,0 +1,45 @@
+import json
+
+from generic_llm_lib.scripts.directory_scanner import DirectoryScanner
+
+
+def test_load_tree_json_round_trip(tmp_path):
+    """A tree written as JSON loads back equal to the original."""
+    tree = {
+        "src": {
+            "pkg": {"core.py": "1.20kb", "utils.py": "0.45kb"},
+            "config.toml": "0.10kb",
+        },
+        "pyproject.toml": "0.80kb",
+    }
+    tree_file = tmp_path / "tree.json"
+    tree_file.write_text(json.dumps(tree))
+
+    loaded = DirectoryScanner.load_tree_json(tree_file)
+
+    assert loaded == tree
+
+
+def test_load_tree_json_accepts_str_path(tmp_path):
+    """load_tree_json takes plain string paths as well as Path objects."""
+    tree_file = tmp_path / "tree.json"
+    tree_file.write_text(json.dumps({"README.json": "0.01kb"}))
+
+    assert DirectoryScanner.load_tree_json(str(tree_file)) == {"README.json": "0.01kb"}
+
+
+def test_scan_and_load_round_trip(tmp_path):
+    """A scanned directory survives the dump/load cycle unchanged."""
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "module.py").write_text("x = 1\n")
+    (tmp_path / "notes.txt").write_text("ignored extension\n")
+
+    scanner = DirectoryScanner()
+    tree = scanner.read_directory_tree(tmp_path)
+
+    tree_file = tmp_path / "tree.json"
+    tree_file.write_text(json.dumps(tree))
+
+    assert DirectoryScanner.load_tree_json(tree_file) == tree
+    assert "module.py" in tree["pkg"]
+    assert "notes.txt" not in tree
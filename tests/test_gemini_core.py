@@ -1,4 +1,5 @@
 import pytest
+from unittest.mock import AsyncMock, MagicMock
 
 from dotenv import load_dotenv, find_dotenv
 
@@ -110,6 +111,30 @@ async def test_gemini_function_calling_with_empty_args(genai_client: AsyncClient
     assert "12:00" in response.content or "noon" in response.content.lower()
 
 
+@pytest.mark.asyncio
+async def test_gemini_chat_stream_yields_deltas_in_order() -> None:
+    def _chunk(text):
+        chunk = MagicMock()
+        chunk.text = text
+        return chunk
+
+    async def fake_stream():
+        for chunk in (_chunk("Hel"), _chunk(""), _chunk(None), _chunk("lo"), _chunk("!")):
+            yield chunk
+
+    chat = MagicMock()
+    chat.send_message_stream = AsyncMock(return_value=fake_stream())
+    client = MagicMock()
+    client.chats.create.return_value = chat
+
+    gemini = GenericGemini(aclient=client, model_name="gemini-2.5-flash", sys_instruction="You are a helper.")
+
+    # Chunks without text are skipped; the rest arrive in stream order.
+    deltas = [delta async for delta in gemini.chat_stream([], "Hi")]
+    assert deltas == ["Hel", "lo", "!"]
+    chat.send_message_stream.assert_awaited_once_with("Hi")
+
+
 @pytest.mark.vcr
 @pytest.mark.asyncio
 async def test_gemini_history_handler_integration(genai_client: AsyncClient) -> None:
@@ -0,0 +1,37 @@
+"""Tests for the HistoryHandler sliding-window trim."""
+
+import pytest
+
+from generic_llm_lib.llm_core.messages import HistoryHandler
+from generic_llm_lib.llm_core.messages.models import SystemMessage, UserMessage
+
+
+def _build_handler(turns: int) -> HistoryHandler:
+    handler = HistoryHandler(system_instruction="sys")
+    for i in range(turns):
+        handler.add_user_message(f"question {i}")
+        handler.add_assistant_message(f"answer {i}")
+    return handler
+
+
+def test_trim_keeps_system_message_and_recent_turns() -> None:
+    handler = _build_handler(turns=10)
+    handler.trim(max_turns=3)
+
+    assert isinstance(handler[0], SystemMessage)
+    # 1 system message + 3 turns of (user, assistant)
+    assert len(handler) == 7
+    first_user = next(msg for msg in handler if isinstance(msg, UserMessage))
+    assert first_user.content == "question 7"
+
+
+def test_trim_is_noop_when_under_window() -> None:
+    handler = _build_handler(turns=2)
+    handler.trim(max_turns=6)
+    assert len(handler) == 5
+
+
+def test_trim_rejects_non_positive_window() -> None:
+    handler = _build_handler(turns=2)
+    with pytest.raises(ValueError):
+        handler.trim(max_turns=0)
@@ -108,6 +108,35 @@ async def test_generic_llm_ask_failure_capture():
     assert llm.chat_impl_mock.call_count == 3
 
 
+@pytest.mark.asyncio
+async def test_generic_llm_retryable_errors_filter():
+    """Test that only listed exception types are retried when a filter is set."""
+    llm = MockLLM(max_retries=3, base_retry_delay=0.01)
+    llm.retryable_errors = (ConnectionError,)
+    expected_result = ChatResult(content="Success", history=[], raw="raw")
+
+    # Transient error is retried, then succeeds
+    llm.chat_impl_mock.side_effect = [ConnectionError("Transient"), expected_result]
+
+    result = await llm.chat([], "hello")
+    assert result == expected_result
+    assert llm.chat_impl_mock.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_generic_llm_non_retryable_error_fails_fast():
+    """Test that exceptions outside the filter propagate without retries."""
+    llm = MockLLM(max_retries=3, base_retry_delay=0.01)
+    llm.retryable_errors = (ConnectionError,)
+
+    llm.chat_impl_mock.side_effect = ValueError("Permanent")
+
+    with pytest.raises(ValueError):
+        await llm.chat([], "hello")
+
+    assert llm.chat_impl_mock.call_count == 1
+
+
 @pytest.mark.asyncio
 async def test_generic_llm_zero_retries():
     """Edge Case: Test behavior when max_retries is 0."""
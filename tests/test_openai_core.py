@@ -1,4 +1,5 @@
 import pytest
+from unittest.mock import AsyncMock, MagicMock
 from openai import AsyncOpenAI
 from generic_llm_lib.llm_core.messages import UserMessage, AssistantMessage, SystemMessage, HistoryHandler
 from generic_llm_lib.llm_core.base import ChatResult
@@ -105,3 +106,50 @@ async def test_openai_function_calling_with_history_handler(openai_client: Async
     history.clean_tool_calls()
     assert len(history.messages) == 3  # System, User, Assistant (content only)
     assert not history.messages[2].tool_calls
+
+
+def _delta_chunk(content):
+    """Builds a minimal streaming chunk carrying one content delta."""
+    chunk = MagicMock()
+    chunk.choices = [MagicMock()]
+    chunk.choices[0].delta.content = content
+    return chunk
+
+
+@pytest.mark.asyncio
+async def test_chat_stream_yields_deltas_in_order() -> None:
+    no_choices = MagicMock()
+    no_choices.choices = []
+
+    async def fake_stream():
+        for chunk in (_delta_chunk("Hel"), no_choices, _delta_chunk(None), _delta_chunk("lo"), _delta_chunk("!")):
+            yield chunk
+
+    client = MagicMock(spec=AsyncOpenAI)
+    client.chat.completions.create = AsyncMock(return_value=fake_stream())
+
+    openai_llm = GenericOpenAI(client=client, model_name=_get_openai_model(), sys_instruction="You are a helper.")
+
+    # Chunks without choices or without a content delta are skipped; the rest
+    # arrive in stream order.
+    deltas = [delta async for delta in openai_llm.chat_stream([], "Hi")]
+    assert deltas == ["Hel", "lo", "!"]
+
+    # The request carries the prepared messages (system instruction + prompt)
+    # and asks for a stream.
+    kwargs = client.chat.completions.create.call_args.kwargs
+    assert kwargs["stream"] is True
+    assert kwargs["messages"][0] == {"role": "system", "content": "You are a helper."}
+    assert kwargs["messages"][-1] == {"role": "user", "content": "Hi"}
+
+
+@pytest.mark.asyncio
+async def test_from_config_builds_pooled_client() -> None:
+    openai_llm = GenericOpenAI.from_config(
+        api_key="test-key", model_name=_get_openai_model(), sys_instruction="You are a helper."
+    )
+    try:
+        assert openai_llm.model == _get_openai_model()
+        assert isinstance(openai_llm.client, AsyncOpenAI)
+    finally:
+        await openai_llm.close()
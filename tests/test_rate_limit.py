@@ -0,0 +1,60 @@
+import time
+from typing import List
+
+import pytest
+from unittest.mock import AsyncMock
+
+from generic_llm_lib.llm_core.base import GenericLLM, ChatResult
+from generic_llm_lib.llm_core.messages import BaseMessage
+
+
+class MockLLM(GenericLLM[str]):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.chat_impl_mock = AsyncMock(return_value=ChatResult(content="ok", history=[], raw="raw"))
+
+    async def _chat_impl(self, history: List[BaseMessage], user_prompt: str) -> ChatResult[str]:
+        return await self.chat_impl_mock(history, user_prompt)
+
+
+@pytest.mark.asyncio
+async def test_no_rate_limit_by_default():
+    """Without requests_per_minute, calls run back-to-back without pacing."""
+    llm = MockLLM()
+
+    start = time.monotonic()
+    for _ in range(5):
+        await llm.ask("hello")
+    elapsed = time.monotonic() - start
+
+    assert llm.chat_impl_mock.call_count == 5
+    assert elapsed < 0.5
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_spaces_out_calls():
+    """Calls beyond the burst are delayed to match the configured rate."""
+    # 600 rpm = 10 requests/s; with burst 1, three calls need >= ~0.2s.
+    llm = MockLLM(requests_per_minute=600, rate_limit_burst=1)
+
+    start = time.monotonic()
+    for _ in range(3):
+        await llm.ask("hello")
+    elapsed = time.monotonic() - start
+
+    assert llm.chat_impl_mock.call_count == 3
+    assert elapsed >= 0.15
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_burst_allows_back_to_back_calls():
+    """Calls within the burst capacity are not delayed."""
+    llm = MockLLM(requests_per_minute=60, rate_limit_burst=3)
+
+    start = time.monotonic()
+    for _ in range(3):
+        await llm.ask("hello")
+    elapsed = time.monotonic() - start
+
+    assert llm.chat_impl_mock.call_count == 3
+    assert elapsed < 0.5
@@ -0,0 +1,115 @@
+"""Tests for the optional response cache on GenericLLM."""
+
+import pytest
+from unittest.mock import AsyncMock
+from typing import List
+
+from generic_llm_lib.llm_core.base import GenericLLM, ChatResult
+from generic_llm_lib.llm_core.messages import BaseMessage, HistoryHandler
+
+
+class MockLLM(GenericLLM[str]):
+    def __init__(self, **kwargs):
+        super().__init__(base_retry_delay=0.01, **kwargs)
+        self.chat_impl_mock = AsyncMock()
+
+    async def _chat_impl(self, history: List[BaseMessage], user_prompt: str) -> ChatResult[str]:
+        return await self.chat_impl_mock(history, user_prompt)
+
+
+@pytest.mark.asyncio
+async def test_cache_hit_skips_provider_call():
+    cache: dict = {}
+    llm = MockLLM(response_cache=cache)
+    llm.chat_impl_mock.return_value = ChatResult(content="Hi", history=[], raw="raw")
+
+    first = await llm.chat([], "hello")
+    second = await llm.chat([], "hello")
+
+    assert llm.chat_impl_mock.call_count == 1
+    assert first == second
+    assert len(cache) == 1
+
+
+@pytest.mark.asyncio
+async def test_different_prompts_miss_cache():
+    llm = MockLLM(response_cache={})
+    llm.chat_impl_mock.return_value = ChatResult(content="Hi", history=[], raw="raw")
+
+    await llm.chat([], "hello")
+    await llm.chat([], "goodbye")
+
+    assert llm.chat_impl_mock.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_no_cache_by_default():
+    llm = MockLLM()
+    llm.chat_impl_mock.return_value = ChatResult(content="Hi", history=[], raw="raw")
+
+    await llm.chat([], "hello")
+    await llm.chat([], "hello")
+
+    assert llm.chat_impl_mock.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_cache_hit_updates_history_handler():
+    llm = MockLLM(response_cache={})
+    cached_history: List[BaseMessage] = []
+    llm.chat_impl_mock.return_value = ChatResult(content="Hi", history=cached_history, raw="raw")
+
+    await llm.chat([], "hello")
+
+    handler = HistoryHandler()
+    result = await llm.chat(handler, "hello")
+
+    assert llm.chat_impl_mock.call_count == 1
+    assert handler.messages == result.history
+
+
+@pytest.mark.asyncio
+async def test_handler_mutation_does_not_corrupt_cache():
+    from generic_llm_lib.llm_core.messages import AssistantMessage, UserMessage
+
+    llm = MockLLM(response_cache={})
+    llm.chat_impl_mock.return_value = ChatResult(
+        content="Hi", history=[UserMessage(content="hello"), AssistantMessage(content="Hi")], raw="raw"
+    )
+
+    handler = HistoryHandler()
+    await llm.chat(handler, "hello")
+    handler.add_user_message("foreign message")
+
+    fresh = HistoryHandler()
+    result = await llm.chat(fresh, "hello")
+
+    assert llm.chat_impl_mock.call_count == 1
+    assert len(result.history) == 2
+    assert all(msg.content != "foreign message" for msg in result.history)
+
+
+@pytest.mark.asyncio
+async def test_keep_raw_applies_on_cache_hit():
+    llm = MockLLM(response_cache={})
+    llm.chat_impl_mock.return_value = ChatResult(content="Hi", history=[], raw="raw")
+
+    first = await llm.chat([], "hello")
+    second = await llm.chat([], "hello", keep_raw=False)
+
+    assert llm.chat_impl_mock.call_count == 1
+    assert first.raw == "raw"
+    assert second.raw is None
+
+
+@pytest.mark.asyncio
+async def test_keep_raw_false_does_not_poison_cache():
+    llm = MockLLM(response_cache={})
+    llm.chat_impl_mock.return_value = ChatResult(content="Hi", history=[], raw="raw")
+
+    first = await llm.chat([], "hello", keep_raw=False)
+    second = await llm.chat([], "hello")
+
+    assert llm.chat_impl_mock.call_count == 1
+    assert first.raw is None
+    assert second.raw == "raw"
@@ -128,3 +128,86 @@ def test_load_specific_tool_registration_error(tool_manager, mock_registry):
 
     with pytest.raises(ToolLoadError, match="Failed to load tool my_tool from dummy_tool: Tool already registered"):
         tool_manager.load_specific_tool("dummy_tool", "my_tool")
+
+
+def test_warmup_preloads_all_modules(tool_manager):
+    """Test that warmup imports every plugin module into the cache."""
+    loaded = tool_manager.warmup(parallel=2)
+    assert loaded == 3
+    assert "dummy_tool" in tool_manager._module_cache
+    assert "no_doc_tool" in tool_manager._module_cache
+    assert "subdir.sub_tool" in tool_manager._module_cache
+
+
+def test_warmup_tolerates_broken_modules(tool_manager, temp_tools_dir):
+    """Test that a module that fails to import does not abort the warmup."""
+    (temp_tools_dir / "broken_tool.py").write_text("raise RuntimeError('boom')\n")
+    loaded = tool_manager.warmup()
+    assert loaded == 3
+    assert "broken_tool" not in tool_manager._module_cache
+
+
+def test_execute_dynamic_plugin_keeps_hot_tool_registered(tool_manager, mock_registry):
+    """Test that repeat executions of the same tool skip re-registration."""
+    mock_registry.tools = {}
+    mock_registry.implementations = {}
+
+    def _register(func):
+        mock_registry.tools[func.__name__] = func
+        mock_registry.implementations[func.__name__] = func
+
+    mock_registry.register.side_effect = _register
+
+    assert tool_manager.execute_dynamic_plugin("dummy_tool", "my_tool", "{}") == "None"
+    assert tool_manager.execute_dynamic_plugin("dummy_tool", "my_tool", "{}") == "None"
+
+    mock_registry.register.assert_called_once()
+    mock_registry.unregister.assert_not_called()
+
+
+def test_execute_dynamic_plugins_batch_returns_per_call_results(tool_manager, mock_registry):
+    """Test that a batch of calls returns one result per call, in order."""
+    mock_registry.tools = {}
+    mock_registry.implementations = {}
+
+    def _register(func):
+        mock_registry.tools[func.__name__] = func
+        mock_registry.implementations[func.__name__] = func
+
+    mock_registry.register.side_effect = _register
+
+    results = tool_manager.execute_dynamic_plugins_batch(
+        [
+            ("dummy_tool", "my_tool", "{}"),
+            ("dummy_tool", "missing_func", "{}"),
+        ]
+    )
+
+    assert len(results) == 2
+    assert results[0] == "None"
+    assert "Critical Error" in results[1]
+
+
+def test_load_specific_tool_already_active_fast_path(tool_manager, mock_registry):
+    """Re-loading a tool that this plugin already registered is a cheap no-op."""
+    tool_manager.load_specific_tool("dummy_tool", "my_tool")
+    args, _ = mock_registry.register.call_args
+    mock_registry.implementations = {"my_tool": args[0]}
+
+    result = tool_manager.load_specific_tool("dummy_tool", "my_tool")
+
+    assert "Success: Tool 'my_tool' is already active." in result
+    mock_registry.register.assert_called_once()
+
+
+def test_load_specific_tool_name_collision_with_foreign_tool(tool_manager, mock_registry):
+    """A same-named tool from another source must not satisfy the fast path."""
+
+    def my_tool():
+        """Unrelated static tool."""
+
+    mock_registry.implementations = {"my_tool": my_tool}
+    mock_registry.register.side_effect = ToolRegistrationError("Tool already registered")
+
+    with pytest.raises(ToolLoadError, match="Tool already registered"):
+        tool_manager.load_specific_tool("dummy_tool", "my_tool")